@@ -1,11 +1,26 @@
 #!/usr/bin/env python3
 """NPC configuration validator script."""
 
+import json
+import os
 import sys
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List
 
+# Prefer the LibYAML-backed loader when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+REQUIRED_FIELDS = ('id', 'name', 'description')
+RECOMMENDED_DIALOGUE = ('greeting_new', 'greeting_return')
+VALID_SCHEDULE_TIMES = frozenset({'morning', 'afternoon', 'evening', 'night'})
+
+# Per-directory record of files that passed validation, keyed by mtime and size
+CACHE_FILE = '.npc_validate_cache.json'
+
 
 def validate_npc_config(file_path: Path) -> tuple[bool, List[str]]:
     """Validate an NPC configuration file.
@@ -17,21 +32,20 @@ def validate_npc_config(file_path: Path) -> tuple[bool, List[str]]:
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f.read(), Loader=SafeLoader)
     except yaml.YAMLError as e:
         return False, [f"YAML parse error: {e}"]
     except Exception as e:
         return False, [f"File read error: {e}"]
 
-    if not data or 'npc' not in data:
+    if not isinstance(data, dict) or 'npc' not in data:
         errors.append("Missing 'npc' root key")
         return False, errors
 
     npc = data['npc']
 
     # Required fields
-    required = ['id', 'name', 'description']
-    for field in required:
+    for field in REQUIRED_FIELDS:
         if field not in npc:
             errors.append(f"Missing required field: {field}")
 
@@ -48,8 +62,7 @@ def validate_npc_config(file_path: Path) -> tuple[bool, List[str]]:
             errors.append("'dialogue' must be a dictionary")
         else:
             # Check for recommended dialogue fields
-            recommended_dialogue = ['greeting_new', 'greeting_return']
-            for field in recommended_dialogue:
+            for field in RECOMMENDED_DIALOGUE:
                 if field not in dialogue:
                     errors.append(f"Warning: Missing recommended dialogue field: {field}")
 
@@ -88,9 +101,8 @@ def validate_npc_config(file_path: Path) -> tuple[bool, List[str]]:
                 if not isinstance(schedule, dict):
                     errors.append("'schedule' must be a dictionary")
                 else:
-                    valid_times = ['morning', 'afternoon', 'evening', 'night']
                     for time in schedule:
-                        if time not in valid_times:
+                        if time not in VALID_SCHEDULE_TIMES:
                             errors.append(f"Invalid schedule time: {time}")
 
     # Validate ambient actions
@@ -106,6 +118,28 @@ def validate_npc_config(file_path: Path) -> tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+def load_cache(cache_path: Path) -> Dict[str, str]:
+    """Load the {file name: "mtime_ns:size"} map of files that last passed.
+
+    The cache is discarded when this script is newer than it, so rule
+    changes always trigger a full re-validation.
+    """
+    try:
+        if cache_path.stat().st_mtime_ns < Path(__file__).stat().st_mtime_ns:
+            return {}
+        return json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, str]):
+    """Persist the validation cache, ignoring write failures."""
+    try:
+        cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding='utf-8')
+    except OSError:
+        pass
+
+
 def main():
     """Validate all NPC configuration files."""
     if len(sys.argv) > 1:
@@ -126,26 +160,57 @@ def main():
     else:
         # Validate all NPC files
         npc_dir = Path(__file__).parent
-        npc_files = list(npc_dir.glob("*.yml"))
 
-        # Skip the template file
-        npc_files = [f for f in npc_files if f.name != "npc_schema_template.yml"]
+        # Single directory pass; DirEntry caches file type. Skip the template
+        # and _-prefixed files (e.g. the config tool's _all.yml bundle), as the
+        # server's NPC loader does
+        with os.scandir(npc_dir) as it:
+            npc_files = [Path(entry.path) for entry in it
+                         if entry.is_file() and entry.name.endswith(".yml")
+                         and entry.name != "npc_schema_template.yml"
+                         and not entry.name.startswith("_")]
 
         if not npc_files:
             print("No NPC configuration files found")
             sys.exit(0)
 
-        all_valid = True
+        # Skip files that passed last time and haven't changed since
+        cache_path = npc_dir / CACHE_FILE
+        cache = load_cache(cache_path)
+        file_keys = {}
+        to_validate = []
         for file_path in npc_files:
-            is_valid, errors = validate_npc_config(file_path)
+            st = file_path.stat()
+            file_keys[file_path.name] = f"{st.st_mtime_ns}:{st.st_size}"
+            if cache.get(file_path.name) == file_keys[file_path.name]:
+                print(f"✓ {file_path.name} (cached)")
+            else:
+                to_validate.append(file_path)
+
+        results = []
+        if to_validate:
+            # Files are independent, so parse and validate them across processes
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunksize = max(1, len(to_validate) // ((os.cpu_count() or 1) * 4))
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(validate_npc_config, to_validate, chunksize=chunksize))
+
+        all_valid = True
+        for file_path, (is_valid, errors) in zip(to_validate, results):
             if is_valid:
+                cache[file_path.name] = file_keys[file_path.name]
                 print(f"✓ {file_path.name}")
             else:
+                cache.pop(file_path.name, None)
                 all_valid = False
                 print(f"✗ {file_path.name}:")
                 for error in errors:
                     print(f"  - {error}")
 
+        # Drop entries for files that no longer exist
+        save_cache(cache_path, {name: key for name, key in cache.items() if name in file_keys})
+
         if not all_valid:
             sys.exit(1)
 
@@ -3,9 +3,11 @@
 import re
 import bcrypt
 import asyncio
+import functools
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Union, TYPE_CHECKING
 
+import config
 from config import (
     MIN_USERNAME_LENGTH, MAX_USERNAME_LENGTH,
     MIN_PASSWORD_LENGTH
@@ -17,39 +19,72 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Usernames are limited to ASCII letters, digits, and underscores
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9_]+\Z')
+
+
+@functools.cache
+def _dummy_hash(rounds: int) -> str:
+    """
+    Get the hash verified against when a username is unknown, so both login
+    failure paths cost the same.
+
+    Made on first use rather than at import, which would cost a full bcrypt
+    hash in every process that imports this module. Cached per work factor so
+    it keeps matching config.BCRYPT_COST. Call it off the event loop.
+    """
+    return bcrypt.hashpw(
+        b'samud-dummy-password', bcrypt.gensalt(rounds=rounds)
+    ).decode('utf-8')
+
 
 class AuthManager:
     """Manages authentication flows for the MUD."""
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    def hash_password(password: bytes) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a UTF-8 encoded password using bcrypt.
+
+        The work factor comes from config.BCRYPT_COST, read on each call so
+        tests can lower it; each increment doubles the hashing time, trading
+        login latency for resistance to brute force.
 
         Returns:
             The hashed password as a string.
         """
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+        salt = bcrypt.gensalt(rounds=config.BCRYPT_COST)
+        hashed = bcrypt.hashpw(password, salt)
         return hashed.decode('utf-8')
 
     @staticmethod
-    def verify_password(password: str, password_hash: str) -> bool:
+    def verify_password(password: bytes, password_hash: Union[bytes, str]) -> bool:
         """
-        Verify a password against its hash.
+        Verify a UTF-8 encoded password against its hash.
 
         Returns:
             True if the password matches, False otherwise.
         """
+        if isinstance(password_hash, str):
+            password_hash = password_hash.encode('utf-8')
+
         try:
-            return bcrypt.checkpw(
-                password.encode('utf-8'),
-                password_hash.encode('utf-8')
-            )
+            return bcrypt.checkpw(password, password_hash)
         except Exception as e:
             logger.error(f"Password verification error: {e}")
             return False
 
+    @staticmethod
+    def _verify_login_password(password: bytes, password_hash: Optional[str]) -> bool:
+        """
+        Verify a login password, against the dummy hash if the user is unknown.
+
+        Runs in a worker thread, so making the dummy hash never blocks the loop.
+        """
+        return AuthManager.verify_password(
+            password, password_hash if password_hash is not None else _dummy_hash(config.BCRYPT_COST)
+        )
+
     @staticmethod
     def validate_username(username: str) -> tuple[bool, str]:
         """
@@ -67,7 +102,11 @@ class AuthManager:
         if len(username) > MAX_USERNAME_LENGTH:
             return False, f"Username cannot exceed {MAX_USERNAME_LENGTH} characters."
 
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        # str methods cover the common case; the regex handles all-underscore names
+        if username.isascii() and username.replace('_', '').isalnum():
+            return True, ""
+
+        if not _USERNAME_RE.match(username):
             return False, "Username can only contain letters, numbers, and underscores."
 
         return True, ""
@@ -153,7 +192,8 @@ class AuthManager:
             return False
 
         # Create account
-        password_hash = self.hash_password(password)
+        # bcrypt releases the GIL, so hashing in a worker keeps other clients responsive
+        password_hash = await asyncio.to_thread(self.hash_password, password.encode('utf-8'))
         player_id = await db.create_player(username, password_hash)
 
         if not player_id:
@@ -193,20 +233,19 @@ class AuthManager:
 
         # Verify credentials
         player = await db.get_player_by_username(username)
-        if not player:
-            await client.send("Invalid username or password.\n")
-            await asyncio.sleep(1)  # Prevent brute force
-            return False
-
-        if not self.verify_password(password, player['password_hash']):
+        password_ok = await asyncio.to_thread(
+            self._verify_login_password, password.encode('utf-8'),
+            player['password_hash'] if player else None
+        )
+        if not player or not password_ok:
             await client.send("Invalid username or password.\n")
             await asyncio.sleep(1)  # Prevent brute force
             return False
 
         # Check if already logged in
-        if player['id'] in server.active_players:
+        other_client = server.active_players.get(player['id'])
+        if other_client is not None:
             await client.send("This account is already logged in. Disconnecting other session...\n")
-            other_client = server.active_players[player['id']]
             await other_client.send("\n[System] You have been disconnected (logged in from another location).\n")
             other_client.is_active = False
             await asyncio.sleep(1)  # Give time for disconnect
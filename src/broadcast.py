@@ -2,13 +2,70 @@
 
 import asyncio
 import logging
-from typing import Optional, List
+import string
+import sys
+from typing import Callable, Optional, List
 from datetime import datetime
 
-from config import ROOM_MESSAGE_FORMAT, GLOBAL_MESSAGE_FORMAT, SYSTEM_MESSAGE_FORMAT
+from config import (
+    ROOM_MESSAGE_FORMAT, GLOBAL_MESSAGE_FORMAT, SYSTEM_MESSAGE_FORMAT,
+    BROADCAST_DRAIN_TIMEOUT, MAX_MESSAGE_LENGTH
+)
 
 logger = logging.getLogger(__name__)
 
+def _compile_message_format(template: str) -> Callable[[str, str], str]:
+    """
+    Turn a "...{username}...{message}..." template into a concatenating formatter.
+
+    Templates of any other shape fall back to str.format.
+    """
+    segments = ['']
+    fields = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        segments[-1] += literal
+        if field_name is not None:
+            fields.append((field_name, format_spec, conversion))
+            segments.append('')
+
+    if fields != [('username', '', None), ('message', '', None)]:
+        def format_message(username: str, message: str) -> str:
+            return template.format(username=username, message=message)
+        return format_message
+
+    prefix, between, suffix = segments
+
+    def format_message(username: str, message: str) -> str:
+        return prefix + username + between + message + suffix
+    return format_message
+
+
+_format_room_message = _compile_message_format(ROOM_MESSAGE_FORMAT)
+_format_global_message = _compile_message_format(GLOBAL_MESSAGE_FORMAT)
+
+_ELLIPSIS = "..."
+
+
+def _truncate(message: str) -> str:
+    """Cap a player message at MAX_MESSAGE_LENGTH, marking the cut."""
+    if len(message) <= MAX_MESSAGE_LENGTH:
+        return message
+    return f"{message[:MAX_MESSAGE_LENGTH]}{_ELLIPSIS}"
+
+# world and player import this module, so they are resolved lazily on first use
+_world = None
+_player_manager = None
+
+
+def _deps():
+    """Return the (world, player_manager) singletons, importing them once."""
+    global _world, _player_manager
+    if _world is None:
+        from world import world
+        from player import player_manager
+        _world, _player_manager = world, player_manager
+    return _world, _player_manager
+
 
 class BroadcastManager:
     """Manages message broadcasting to players."""
@@ -29,33 +86,28 @@ class BroadcastManager:
             exclude_player_id: Player ID to exclude from broadcast
             is_system: Whether this is a system message
         """
-        from player import player_manager
-        from world import world
+        world, player_manager = _deps()
 
         room = world.get_room(room_id)
         if not room:
             logger.warning(f"Attempted to broadcast to non-existent room: {room_id}")
             return
 
+        # Ambient NPC chatter often lands in empty rooms; skip formatting then
+        recipients = self._recipients(player_manager.get_players_in_room(room_id),
+                                      exclude_player_id)
+        if not recipients:
+            return
+
         # Format message if it's a system message
         if is_system:
             formatted_message = f"[System] {message}"
         else:
             formatted_message = message
 
-        # Get players in room
-        players = player_manager.get_players_in_room(room_id)
-
-        # Send to each player
-        tasks = []
-        for player in players:
-            if player.id != exclude_player_id:
-                tasks.append(self._send_to_player(player, formatted_message))
+        sent = await self._write_to_players(recipients, formatted_message)
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        logger.debug(f"Broadcasted to {len(tasks)} players in {room_id}: {message[:50]}")
+        logger.debug(f"Broadcasted to {sent} players in {room_id}: {message[:50]}")
 
     async def broadcast_to_all(self, message: str,
                               exclude_player_id: Optional[int] = None):
@@ -66,36 +118,35 @@ class BroadcastManager:
             message: The message to send
             exclude_player_id: Player ID to exclude from broadcast
         """
-        from player import player_manager
+        _, player_manager = _deps()
 
-        players = player_manager.get_online_players()
-
-        tasks = []
-        for player in players:
-            if player.id != exclude_player_id:
-                tasks.append(self._send_to_player(player, message))
+        recipients = self._recipients(player_manager.get_online_players(),
+                                      exclude_player_id)
+        if not recipients:
+            return
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        sent = await self._write_to_players(recipients, message)
 
-        logger.debug(f"Global broadcast to {len(tasks)} players: {message[:50]}")
+        logger.debug(f"Global broadcast to {sent} players: {message[:50]}")
 
     async def broadcast_room_message(self, room_id: str, username: str,
-                                    message: str):
+                                    message: str) -> str:
         """
         Broadcast a player's message to their room.
 
         Args:
             room_id: The room to broadcast to
             username: The speaking player's username
-            message: The message they said
+            message: The message they said (truncated here if too long)
+
+        Returns:
+            The message as sent, i.e. after truncation
         """
-        formatted = ROOM_MESSAGE_FORMAT.format(
-            username=username,
-            message=message
-        )
+        message = _truncate(message)
+        formatted = _format_room_message(username, message)
         await self.broadcast_to_room(room_id, formatted, exclude_player_id=None,
                                     is_system=False)
+        return message
 
     async def broadcast_global_message(self, username: str, message: str,
                                       sender_id: Optional[int] = None):
@@ -107,18 +158,78 @@ class BroadcastManager:
             message: The message they shouted
             sender_id: The sender's player ID (to include them in broadcast)
         """
-        formatted = GLOBAL_MESSAGE_FORMAT.format(
-            username=username,
-            message=message
-        )
+        formatted = _format_global_message(username, _truncate(message))
         # Don't exclude sender for global messages - they should see their own shout
         await self.broadcast_to_all(formatted, exclude_player_id=None)
 
-    async def _send_to_player(self, player, message: str):
-        """Send a message to a specific player."""
+    @staticmethod
+    def _recipients(players, exclude_player_id: Optional[int] = None) -> list:
+        """Filter players down to those with an active client."""
+        return [p for p in players
+                if p.id != exclude_player_id and p.client and p.client.is_active]
+
+    async def _write_to_players(self, players, message: str) -> int:
+        """
+        Fan a message out to many players with one encode and no per-player tasks.
+
+        Writes are queued synchronously; only clients whose output buffer is
+        above the high-water mark are awaited.
+
+        Args:
+            players: Recipients, already filtered by _recipients
+            message: The message to send
+
+        Returns:
+            The number of players written to.
+        """
+        if not players:
+            return 0
+
+        buf = players[0].client.encode(f"\n{message}")
+        sent = 0
+        congested = []
+        for player in players:
+            client = player.client
+            try:
+                if client.write_nowait(buf):
+                    congested.append(player)
+                sent += 1
+            except Exception as e:
+                logger.error(f"Failed to send to player {player.username}: {e}")
+
+        if congested:
+            # Bound how long one slow client can hold up the sender; queued
+            # bytes stay in the transport buffer either way
+            try:
+                await asyncio.wait_for(self._drain_players(congested),
+                                       timeout=BROADCAST_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.debug(f"Broadcast drain timed out for {len(congested)} players")
+
+        return sent
+
+    async def _drain_players(self, players):
+        """Drain several congested players concurrently."""
+        # _drain_player swallows its own errors, so nothing can escape here
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                for player in players:
+                    tg.create_task(self._drain_player(player))
+        else:
+            await asyncio.gather(*(self._drain_player(p) for p in players))
+
+    async def _drain_player(self, player):
+        """Wait for a congested player's output buffer to flush."""
+        try:
+            await player.client.drain()
+        except Exception as e:
+            logger.error(f"Failed to send to player {player.username}: {e}")
+
+    async def _send_to_player(self, player, buf: bytes):
+        """Send an already-encoded message to a specific player."""
         try:
             if player.client and player.client.is_active:
-                await player.client.send(f"\n{message}")
+                await player.client.send_bytes(buf)
         except Exception as e:
             logger.error(f"Failed to send to player {player.username}: {e}")
 
@@ -140,19 +251,19 @@ class BroadcastManager:
 
     async def send_to_player_by_id(self, player_id: int, message: str):
         """Send a message directly to a specific player by ID."""
-        from player import player_manager
+        _, player_manager = _deps()
 
         player = player_manager.get_player(player_id)
-        if player:
-            await self._send_to_player(player, message)
+        if player and player.client:
+            await self._send_to_player(player, player.client.encode(f"\n{message}"))
 
     async def send_to_player_by_username(self, username: str, message: str):
         """Send a message directly to a specific player by username."""
-        from player import player_manager
+        _, player_manager = _deps()
 
         player = player_manager.get_player_by_username(username)
-        if player:
-            await self._send_to_player(player, message)
+        if player and player.client:
+            await self._send_to_player(player, player.client.encode(f"\n{message}"))
 
 
 # Global broadcast manager instance
@@ -173,9 +284,9 @@ async def broadcast_to_all(message: str, exclude_player_id: Optional[int] = None
     await broadcast_manager.broadcast_to_all(message, exclude_player_id)
 
 
-async def broadcast_room_message(room_id: str, username: str, message: str):
+async def broadcast_room_message(room_id: str, username: str, message: str) -> str:
     """Convenience function for room messages."""
-    await broadcast_manager.broadcast_room_message(room_id, username, message)
+    return await broadcast_manager.broadcast_room_message(room_id, username, message)
 
 
 async def broadcast_global_message(username: str, message: str,
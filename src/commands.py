@@ -1,24 +1,61 @@
 """Commands module for SAMUD - handles command parsing and execution."""
 
 import asyncio
+import difflib
 import logging
-import re
+import sys
 from typing import Dict, Callable, Optional, List, TYPE_CHECKING
 from dataclasses import dataclass
 
-from config import COMMANDS, MOVEMENT_SHORTCUTS, MAX_MESSAGE_LENGTH
+from config import COMMANDS, MOVEMENT_SHORTCUTS, ENCODING
 from world import world
 from player import player_manager
 from broadcast import broadcast_room_message, broadcast_global_message
 from database import db
+from commands_trie import build_radix, trie_prefix_collect
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz_process = None
 
 if TYPE_CHECKING:
     from server import Client
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Bound once; handlers call these on every command
+_get_player = player_manager.get_player
+_get_room = world.get_room
+
+
+def _encode(text: str) -> bytes:
+    """Encode static text for the wire, matching Client.encode."""
+    return text.replace('\n', '\r\n').encode(ENCODING)
+
+
+# Fixed replies, encoded once
+_MSG_NOT_LOGGED_IN = _encode("You are not properly logged in.\n")
+_MSG_MUST_LOG_IN = _encode("You must be logged in to use that command.\n")
+_MSG_COMMAND_ERROR = _encode("An error occurred while processing your command.\n")
+_MSG_IN_VOID = _encode("You are in a void. Something went wrong!\n")
+_MSG_MOVE_WHERE = _encode("Move where? Usage: move <direction>\n")
+_MSG_CANNOT_MOVE = _encode("You cannot move from here.\n")
+_MSG_LEADS_NOWHERE = _encode("That direction leads nowhere.\n")
+_MSG_LOCATION_UNKNOWN = _encode("Your location is unknown.\n")
+_MSG_SAY_WHAT = _encode("Say what? Usage: say <message>\n")
+_MSG_SAY_TOO_FAST = _encode("You are speaking too quickly. Please slow down.\n")
+_MSG_SHOUT_WHAT = _encode("Shout what? Usage: shout <message>\n")
+_MSG_SHOUT_TOO_FAST = _encode("You are shouting too quickly. Please slow down.\n")
+_MSG_NO_PLAYERS = _encode("No players online.\n")
+_MSG_SAVING = _encode("Saving your progress...\n")
+_MSG_GOODBYE = _encode("Goodbye! Come back soon!\n")
+_MSG_RELOADING = _encode("Reloading room definitions from YAML files...\n")
+_MSG_RELOADED = _encode("Rooms successfully reloaded!\n")
+_MSG_RELOAD_FAILED = _encode("Failed to reload rooms. Check server logs for details.\n")
+
+
+@dataclass(slots=True, frozen=True)
 class Command:
     """Represents a command that can be executed."""
     name: str
@@ -26,6 +63,7 @@ class Command:
     description: str
     requires_auth: bool = True
     usage: Optional[str] = None
+    touches_activity: bool = True  # False for read-only commands that don't bump last_activity
 
 
 class CommandProcessor:
@@ -33,12 +71,19 @@ class CommandProcessor:
 
     def __init__(self):
         self.commands: Dict[str, Command] = {}
+        # Dispatch tables: everything for logged-in clients, only the
+        # requires_auth=False commands for everyone else
+        self._authed: Dict[str, Command] = {}
+        self._unauth: Dict[str, Command] = {}
         self._register_commands()
+        self._trie = build_radix(self.commands)  # Names only, for suggestions
+        self._build_help()
 
     def _register_commands(self):
         """Register all available commands."""
         # Navigation commands
-        self.register("look", self.cmd_look, "Show room description, exits, and players")
+        self.register("look", self.cmd_look, "Show room description, exits, and players",
+                      touches_activity=False)
         self.register("move", self.cmd_move, "Move in a direction", usage="move <direction>")
         self.register("n", self.cmd_north, "Move north")
         self.register("north", self.cmd_north, "Move north")
@@ -48,7 +93,8 @@ class CommandProcessor:
         self.register("east", self.cmd_east, "Move east")
         self.register("w", self.cmd_west, "Move west")
         self.register("west", self.cmd_west, "Move west")
-        self.register("where", self.cmd_where, "Show your current location")
+        self.register("where", self.cmd_where, "Show your current location",
+                      touches_activity=False)
 
         # Communication commands
         self.register("say", self.cmd_say, "Say something to everyone in the room",
@@ -57,21 +103,55 @@ class CommandProcessor:
                       usage="shout <message>")
 
         # System commands
-        self.register("who", self.cmd_who, "Show all online players")
-        self.register("help", self.cmd_help, "Show available commands")
-        self.register("quit", self.cmd_quit, "Save and disconnect")
-        self.register("exit", self.cmd_quit, "Save and disconnect")
+        self.register("who", self.cmd_who, "Show all online players", touches_activity=False)
+        self.register("help", self.cmd_help, "Show available commands", touches_activity=False)
+        self.register("quit", self.cmd_quit, "Save and disconnect", touches_activity=False)
+        self.register("exit", self.cmd_quit, "Save and disconnect", touches_activity=False)
+
+    def _build_help(self):
+        """Prebuild the encoded help screens so cmd_help is a single write."""
+        lines = ["\n=== Available Commands ===\n"]
+
+        # Group commands by category
+        categories = [
+            ("Navigation", ["look", "move", "n", "s", "e", "w", "where"]),
+            ("Communication", ["say", "shout"]),
+            ("System", ["who", "help", "quit"]),
+        ]
+        for category, names in categories:
+            lines.append(f"\n{category}:\n")
+            for cmd_name in names:
+                if cmd_name in self.commands:
+                    cmd = self.commands[cmd_name]
+                    lines.append(f"  {cmd.name:10} - {cmd.description}\n")
+
+        lines.append("\nType 'help <command>' for more information about a specific command.\n")
+        self._help_blob_full = _encode("".join(lines))
+
+        self._help_blob_per_cmd: Dict[str, bytes] = {}
+        for cmd_name, command in self.commands.items():
+            text = f"\n{command.name.upper()}: {command.description}\n"
+            if command.usage:
+                text += f"Usage: {command.usage}\n"
+            self._help_blob_per_cmd[cmd_name] = _encode(text)
 
     def register(self, name: str, handler: Callable, description: str,
-                 usage: Optional[str] = None, requires_auth: bool = True):
+                 usage: Optional[str] = None, requires_auth: bool = True,
+                 touches_activity: bool = True):
         """Register a new command."""
-        self.commands[name.lower()] = Command(
+        key = sys.intern(name.lower())
+        command = Command(
             name=name,
             handler=handler,
             description=description,
             requires_auth=requires_auth,
-            usage=usage
+            usage=usage,
+            touches_activity=touches_activity
         )
+        self.commands[key] = command
+        self._authed[key] = command
+        if not requires_auth:
+            self._unauth[key] = command
 
     async def process_command(self, client: 'Client', input_text: str) -> bool:
         """
@@ -83,14 +163,30 @@ class CommandProcessor:
         if not input_text:
             return False
 
-        # Parse command and arguments
-        parts = input_text.strip().split(maxsplit=1)
-        command_name = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-
-        # Find command
-        command = self.commands.get(command_name)
+        # Parse command and arguments with a single scan instead of strip/split
+        length = len(input_text)
+        start = 0
+        while start < length and input_text[start].isspace():
+            start += 1
+        if start == length:
+            return False
+        end = start
+        while end < length and not input_text[end].isspace():
+            end += 1
+
+        command_name = input_text[start:end]
+        if not command_name.islower():
+            command_name = command_name.lower()
+        args = input_text[end:].strip() if end < length else ""
+
+        # Find command in the table for this client's auth state
+        table = self._authed if client.authenticated else self._unauth
+        command = table.get(command_name)
         if not command:
+            if command_name in self._authed:
+                await client.send(_MSG_MUST_LOG_IN)
+                return False
+
             # Try to find similar commands for suggestion
             similar = self._find_similar_commands(command_name)
             if similar:
@@ -99,14 +195,9 @@ class CommandProcessor:
                 await client.send(f"Unknown command '{command_name}'. Type 'help' for available commands.\n")
             return False
 
-        # Check authentication requirement
-        if command.requires_auth and not client.authenticated:
-            await client.send("You must be logged in to use that command.\n")
-            return False
-
-        # Update player activity
-        if client.player_id:
-            player = player_manager.get_player(client.player_id)
+        # Update player activity (connection idleness is tracked by Client.readline)
+        if command.touches_activity and client.player_id:
+            player = _get_player(client.player_id)
             if player:
                 player.update_activity()
 
@@ -116,76 +207,69 @@ class CommandProcessor:
             return True
         except Exception as e:
             logger.error(f"Error executing command {command_name}: {e}")
-            await client.send("An error occurred while processing your command.\n")
+            await client.send(_MSG_COMMAND_ERROR)
             return False
 
     def _find_similar_commands(self, command_name: str) -> List[str]:
         """Find commands similar to the given name."""
-        similar = []
-        for cmd in self.commands.keys():
-            # Check if command starts with the given text
-            if cmd.startswith(command_name):
-                similar.append(cmd)
-            # Check Levenshtein distance for typos (simple version)
-            elif len(cmd) > 3 and len(command_name) > 3:
-                if abs(len(cmd) - len(command_name)) <= 2:
-                    matches = sum(1 for a, b in zip(cmd, command_name) if a == b)
-                    if matches >= len(command_name) - 2:
-                        similar.append(cmd)
-        return similar[:3]  # Return top 3 suggestions
+        # Edit-distance match first (RapidFuzz when installed, difflib otherwise)
+        if fuzz_process is not None:
+            matches = fuzz_process.extract(command_name, self.commands.keys(),
+                                           scorer=fuzz.ratio, limit=3, score_cutoff=60)
+            similar = [name for name, _score, _index in matches]
+        else:
+            similar = difflib.get_close_matches(command_name, self.commands.keys(), n=3, cutoff=0.6)
+
+        # Short inputs score poorly against long names; fall back to prefix matches
+        return similar or trie_prefix_collect(self._trie, command_name, limit=3)
 
     # === Navigation Commands ===
 
     async def cmd_look(self, client: 'Client', args: str):
         """Look at the current room."""
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
         if not player:
-            await client.send("You are not properly logged in.\n")
+            await client.send(_MSG_NOT_LOGGED_IN)
             return
 
-        room = world.get_room(player.current_room_id)
+        room = _get_room(player.current_room_id)
         if not room:
-            await client.send("You are in a void. Something went wrong!\n")
+            await client.send(_MSG_IN_VOID)
             return
 
-        # Send room information with ASCII art
-        await client.send(f"\n{room.name}\n")
-        if room.ascii_art:
-            await client.send(f"{room.ascii_art}\n")
-        await client.send(f"{room.description}\n")
-        await client.send(f"Exits: {room.get_exit_list()}\n")
-
         # Show NPCs in room
         from npcs import npc_manager
         npcs = npc_manager.get_npcs_in_room(room.id)
+        parts = []
         if npcs:
-            await client.send("\n")
+            parts.append("\n")
             if len(npcs) == 1:
-                npc = npcs[0]
-                await client.send(f"{npc.description}\n")
+                parts.append(f"{npcs[0].description}\n")
             else:
-                await client.send("You see:\n")
+                parts.append("You see:\n")
                 for npc in npcs:
-                    await client.send(f"  - {npc.description}\n")
+                    parts.append(f"  - {npc.description}\n")
 
         # Show other players in room
-        players = player_manager.get_players_in_room(room.id)
-        other_players = [p for p in players if p.id != player.id]
-        if other_players:
-            names = [p.username for p in other_players]
-            await client.send(f"\nPlayers here: {', '.join(names)}\n")
+        others = player_manager.get_room_usernames_excluding(room.id, player.id)
+        if others:
+            parts.append(f"\nPlayers here: {others}\n")
         elif not npcs:
-            await client.send("\nYou are alone here.\n")
+            parts.append("\nYou are alone here.\n")
         else:
-            await client.send("\nNo other players here.\n")
+            parts.append("\nNo other players here.\n")
+
+        # Send room information with ASCII art in a single write
+        await client.send_all(room.render(), *parts)
 
     async def cmd_move(self, client: 'Client', args: str):
         """Move in a specified direction."""
         if not args:
-            await client.send("Move where? Usage: move <direction>\n")
+            await client.send(_MSG_MOVE_WHERE)
             return
 
         direction = args.lower().strip()
+        direction = MOVEMENT_SHORTCUTS.get(direction, direction)
         await self._move_player(client, direction)
 
     async def cmd_north(self, client: 'Client', args: str):
@@ -206,19 +290,15 @@ class CommandProcessor:
 
     async def _move_player(self, client: 'Client', direction: str):
         """Handle player movement in a direction."""
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
         if not player:
-            await client.send("You are not properly logged in.\n")
+            await client.send(_MSG_NOT_LOGGED_IN)
             return
 
-        # Expand shortcuts
-        if direction in MOVEMENT_SHORTCUTS:
-            direction = MOVEMENT_SHORTCUTS[direction]
-
         # Get current room
-        room = world.get_room(player.current_room_id)
+        room = _get_room(player.current_room_id)
         if not room:
-            await client.send("You cannot move from here.\n")
+            await client.send(_MSG_CANNOT_MOVE)
             return
 
         # Check if exit exists
@@ -228,68 +308,53 @@ class CommandProcessor:
 
         # Get destination room
         dest_room_id = room.exits[direction]
-        dest_room = world.get_room(dest_room_id)
+        dest_room = _get_room(dest_room_id)
         if not dest_room:
-            await client.send("That direction leads nowhere.\n")
+            await client.send(_MSG_LEADS_NOWHERE)
             return
 
         # Move player
         await player.move_to_room(dest_room_id, direction)
 
-        # Show new room with ASCII art
-        await client.send(f"\n{dest_room.name}\n")
-        if dest_room.ascii_art:
-            await client.send(f"{dest_room.ascii_art}\n")
-        await client.send(f"{dest_room.description}\n")
-        await client.send(f"Exits: {dest_room.get_exit_list()}\n")
-
-        # Show other players
-        players = player_manager.get_players_in_room(dest_room_id)
-        other_players = [p for p in players if p.id != player.id]
-        if other_players:
-            names = [p.username for p in other_players]
-            await client.send(f"Players here: {', '.join(names)}\n")
+        # Show new room with ASCII art and other players
+        others = player_manager.get_room_usernames_excluding(dest_room_id, player.id)
+        await client.send(dest_room.render(f"Players here: {others}\n" if others else ""))
 
     async def cmd_where(self, client: 'Client', args: str):
         """Show current location."""
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
         if not player:
-            await client.send("You are not properly logged in.\n")
+            await client.send(_MSG_NOT_LOGGED_IN)
             return
 
-        room = world.get_room(player.current_room_id)
+        room = _get_room(player.current_room_id)
         if room:
             await client.send(f"You are at: {room.name}\n")
         else:
-            await client.send("Your location is unknown.\n")
+            await client.send(_MSG_LOCATION_UNKNOWN)
 
     # === Communication Commands ===
 
     async def cmd_say(self, client: 'Client', args: str):
         """Say something to the room."""
         if not args:
-            await client.send("Say what? Usage: say <message>\n")
+            await client.send(_MSG_SAY_WHAT)
             return
 
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
         if not player:
-            await client.send("You are not properly logged in.\n")
+            await client.send(_MSG_NOT_LOGGED_IN)
             return
 
         # Check rate limit
         if not player.check_rate_limit():
-            await client.send("You are speaking too quickly. Please slow down.\n")
+            await client.send(_MSG_SAY_TOO_FAST)
             return
 
-        # Truncate message if too long
-        message = args[:MAX_MESSAGE_LENGTH]
-        if len(args) > MAX_MESSAGE_LENGTH:
-            message += "..."
-
-        # Send to room
-        await broadcast_room_message(player.current_room_id, player.username, message)
+        # Send to room (the broadcast layer truncates long messages)
+        message = await broadcast_room_message(player.current_room_id, player.username, args)
 
-        # Check for NPC responses (run in background)
+        # Check for NPC responses (run in background) against the text as sent
         from npcs import npc_manager
         asyncio.create_task(
             npc_manager.process_room_message(
@@ -300,26 +365,21 @@ class CommandProcessor:
     async def cmd_shout(self, client: 'Client', args: str):
         """Shout to all players."""
         if not args:
-            await client.send("Shout what? Usage: shout <message>\n")
+            await client.send(_MSG_SHOUT_WHAT)
             return
 
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
         if not player:
-            await client.send("You are not properly logged in.\n")
+            await client.send(_MSG_NOT_LOGGED_IN)
             return
 
         # Check rate limit
         if not player.check_rate_limit():
-            await client.send("You are shouting too quickly. Please slow down.\n")
+            await client.send(_MSG_SHOUT_TOO_FAST)
             return
 
-        # Truncate message if too long
-        message = args[:MAX_MESSAGE_LENGTH]
-        if len(args) > MAX_MESSAGE_LENGTH:
-            message += "..."
-
-        # Send globally
-        await broadcast_global_message(player.username, message, player.id)
+        # Send globally (the broadcast layer truncates long messages)
+        await broadcast_global_message(player.username, args, player.id)
 
     # === System Commands ===
 
@@ -328,68 +388,39 @@ class CommandProcessor:
         players = player_manager.get_online_players()
 
         if not players:
-            await client.send("No players online.\n")
+            await client.send(_MSG_NO_PLAYERS)
             return
 
-        await client.send(f"\n=== Online Players ({len(players)}) ===\n")
+        lines = [f"\n=== Online Players ({len(players)}) ===\n"]
         for player in sorted(players, key=lambda p: p.username.lower()):
-            room = world.get_room(player.current_room_id)
-            room_name = room.name if room else "Unknown"
-            await client.send(f"  {player.username:<20} - {room_name}\n")
+            lines.append(f"  {player.username:<20} - {player.current_room_name}\n")
+        await client.send_all(*lines)
 
     async def cmd_help(self, client: 'Client', args: str):
         """Show help for commands."""
         if args:
             # Show help for specific command
             cmd_name = args.lower().strip()
-            command = self.commands.get(cmd_name)
-            if command:
-                await client.send(f"\n{command.name.upper()}: {command.description}\n")
-                if command.usage:
-                    await client.send(f"Usage: {command.usage}\n")
+            blob = self._help_blob_per_cmd.get(cmd_name)
+            if blob:
+                await client.send(blob)
             else:
                 await client.send(f"No help available for '{cmd_name}'.\n")
         else:
-            # Show all commands
-            await client.send("\n=== Available Commands ===\n")
-
-            # Group commands by category
-            navigation = ["look", "move", "n", "s", "e", "w", "where"]
-            communication = ["say", "shout"]
-            system = ["who", "help", "quit"]
-
-            await client.send("\nNavigation:\n")
-            for cmd_name in navigation:
-                if cmd_name in self.commands:
-                    cmd = self.commands[cmd_name]
-                    await client.send(f"  {cmd.name:10} - {cmd.description}\n")
-
-            await client.send("\nCommunication:\n")
-            for cmd_name in communication:
-                if cmd_name in self.commands:
-                    cmd = self.commands[cmd_name]
-                    await client.send(f"  {cmd.name:10} - {cmd.description}\n")
-
-            await client.send("\nSystem:\n")
-            for cmd_name in system:
-                if cmd_name in self.commands:
-                    cmd = self.commands[cmd_name]
-                    await client.send(f"  {cmd.name:10} - {cmd.description}\n")
-
-            await client.send("\nType 'help <command>' for more information about a specific command.\n")
+            await client.send(self._help_blob_full)
 
     async def cmd_quit(self, client: 'Client', args: str):
         """Save and quit the game."""
-        player = player_manager.get_player(client.player_id)
+        player = _get_player(client.player_id)
 
-        await client.send("Saving your progress...\n")
+        await client.send(_MSG_SAVING)
 
         # Save player state
         if player:
             await db.update_player_room(player.id, player.current_room_id)
             await player_manager.remove_player(player.id)
 
-        await client.send("Goodbye! Come back soon!\n")
+        await client.send(_MSG_GOODBYE)
         client.is_active = False
 
     async def cmd_reload(self, client: 'Client', args: str):
@@ -397,23 +428,29 @@ class CommandProcessor:
         # This is a development/admin command
         # In production, you might want to check for admin privileges here
 
-        await client.send("Reloading room definitions from YAML files...\n")
+        await client.send(_MSG_RELOADING)
 
         if world.reload_rooms():
-            await client.send("Rooms successfully reloaded!\n")
+            await client.send(_MSG_RELOADED)
 
             # Show current room again to confirm it still exists
-            player = player_manager.get_player(client.player_id)
+            player = _get_player(client.player_id)
             if player:
-                room = world.get_room(player.current_room_id)
+                room = _get_room(player.current_room_id)
                 if room:
                     await client.send(f"You are still in: {room.name}\n")
                 else:
                     # Move player to starting room if their room no longer exists
+                    old_room_id = player.current_room_id
                     player.current_room_id = world.starting_room
+                    player_manager.update_room_index(player, old_room_id)
                     await client.send(f"Your previous location no longer exists. Moving to {world.starting_room}.\n")
+
+            # Room names may have changed
+            for online_player in player_manager.get_online_players():
+                online_player.refresh_room_name()
         else:
-            await client.send("Failed to reload rooms. Check server logs for details.\n")
+            await client.send(_MSG_RELOAD_FAILED)
 
 
 # Global command processor instance
@@ -0,0 +1,95 @@
+"""Command trie module for SAMUD - radix tree for "Did you mean" suggestions.
+
+Command dispatch itself uses plain dict lookups; the tree only stores the
+command names so a mistyped prefix can be expanded into suggestions.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+
+@dataclass
+class RadixNode:
+    """A node in a radix (compressed prefix) tree."""
+
+    prefix: str = ""
+    children: Dict[str, 'RadixNode'] = field(default_factory=dict)  # first char -> child
+    key: Optional[str] = None  # Full key stored at this node, if any
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Get the length of the shared prefix of two strings."""
+    length = min(len(a), len(b))
+    for i in range(length):
+        if a[i] != b[i]:
+            return i
+    return length
+
+
+def radix_insert(root: RadixNode, key: str):
+    """Insert a key into the tree, splitting edges on the longest common prefix."""
+    node = root
+    rest = key
+
+    while rest:
+        child = node.children.get(rest[0])
+        if child is None:
+            node.children[rest[0]] = RadixNode(prefix=rest, key=key)
+            return
+
+        common = _common_prefix_length(child.prefix, rest)
+        if common < len(child.prefix):
+            # Split the edge so the shared part becomes its own node
+            split = RadixNode(prefix=child.prefix[:common])
+            child.prefix = child.prefix[common:]
+            split.children[child.prefix[0]] = child
+            node.children[rest[0]] = split
+            child = split
+
+        node = child
+        rest = rest[common:]
+
+    node.key = key
+
+
+def build_radix(keys: Iterable[str]) -> RadixNode:
+    """Build a radix tree from some keys."""
+    root = RadixNode()
+    for key in keys:
+        radix_insert(root, key)
+    return root
+
+
+def trie_prefix_collect(root: RadixNode, key: str, limit: int = 3) -> List[str]:
+    """
+    Suggest stored keys for an input that may be a prefix or a typo.
+
+    Descends as far as the input matches, then collects up to `limit` keys
+    beneath that point. Returns nothing if not even the first character matches.
+    """
+    node = root
+    rest = key
+
+    while rest:
+        child = node.children.get(rest[0])
+        if child is None:
+            break
+        node = child
+        if not rest.startswith(child.prefix):
+            # Input ends or diverges partway along this edge
+            break
+        rest = rest[len(child.prefix):]
+
+    if node is root:
+        return []
+
+    results: List[str] = []
+    stack = [node]
+    while stack and len(results) < limit:
+        current = stack.pop()
+        if current.key is not None:
+            results.append(current.key)
+        # Push in reverse so children are visited in sorted order
+        stack.extend(current.children[c] for c in sorted(current.children, reverse=True))
+
+    return results
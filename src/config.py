@@ -7,20 +7,23 @@ from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
+environ = os.environ
 
 # Server Configuration
-HOST = os.getenv('HOST', '0.0.0.0')
-PORT = int(os.getenv('PORT', 2323))
-MAX_CONNECTIONS = int(os.getenv('MAX_CONNECTIONS', 50))
-BUFFER_SIZE = int(os.getenv('BUFFER_SIZE', 4096))
+HOST = environ.get('HOST', '0.0.0.0')
+PORT = int(environ.get('PORT', 2323))
+MAX_CONNECTIONS = int(environ.get('MAX_CONNECTIONS', 50))
+BUFFER_SIZE = int(environ.get('BUFFER_SIZE', 4096))
+WRITE_HIGH_WATER = 64 * 1024  # Pending output bytes before a client write must drain
+BROADCAST_DRAIN_TIMEOUT = 5  # Seconds a broadcast waits on congested clients
 ENCODING = 'utf-8'
 
 # Database Configuration
-DB_PATH = Path(os.getenv('DB_PATH', 'data/samud.db'))
+DB_PATH = Path(environ.get('DB_PATH', 'data/samud.db'))
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 # Game Configuration
-IDLE_TIMEOUT = int(os.getenv('IDLE_TIMEOUT', 1800))  # 30 minutes in seconds
+IDLE_TIMEOUT = int(environ.get('IDLE_TIMEOUT', 1800))  # 30 minutes in seconds
 IDLE_WARNING_TIME = IDLE_TIMEOUT - 300  # Warn 5 minutes before timeout
 # DEFAULT_ROOM is now configured in data/rooms/zones.yml
 MAX_MESSAGE_LENGTH = 250
@@ -29,14 +32,17 @@ MIN_USERNAME_LENGTH = 3
 MAX_USERNAME_LENGTH = 20
 MIN_PASSWORD_LENGTH = 6
 
+# Security Configuration
+BCRYPT_COST = int(environ.get('BCRYPT_COST', 12))  # log2 of bcrypt work factor (4-31)
+
 # Telnet Configuration
-TELNET_IAC = bytes([255])  # Interpret as Command
-TELNET_WILL = bytes([251])
-TELNET_WONT = bytes([252])
-TELNET_DO = bytes([253])
-TELNET_DONT = bytes([254])
-TELNET_ECHO = bytes([1])
-TELNET_SGA = bytes([3])  # Suppress Go Ahead
+TELNET_IAC = b'\xff'  # Interpret as Command
+TELNET_WILL = b'\xfb'
+TELNET_WONT = b'\xfc'
+TELNET_DO = b'\xfd'
+TELNET_DONT = b'\xfe'
+TELNET_ECHO = b'\x01'
+TELNET_SGA = b'\x03'  # Suppress Go Ahead
 
 # Room IDs are now loaded from YAML files in data/rooms/
 
@@ -70,7 +76,7 @@ GLOBAL_MESSAGE_FORMAT = "[Global] {username}: {message}"
 SYSTEM_MESSAGE_FORMAT = "[System] {message}"
 
 # Logging Configuration
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVEL = environ.get('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
@@ -3,12 +3,16 @@ Shared UI components for the configuration tool
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-from typing import Optional, List, Callable, Dict
+from typing import Optional, List, Callable, Dict, Tuple
 from pathlib import Path
 
 
 class SearchableListbox(tk.Frame):
-    """A listbox with search functionality"""
+    """A list with search functionality
+
+    Backed by a ttk.Treeview whose item ids are indexes into all_items, so
+    filtering re-attaches existing rows in one call instead of re-inserting them.
+    """
 
     def __init__(self, parent, **kwargs):
         super().__init__(parent)
@@ -23,23 +27,44 @@ class SearchableListbox(tk.Frame):
         self.search_entry = tk.Entry(search_frame, textvariable=self.search_var)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
 
-        # Listbox with scrollbar
+        # List with scrollbar
         list_frame = tk.Frame(self)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, **kwargs)
-        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.listbox.yview)
+        self.tree = ttk.Treeview(list_frame, show='tree', selectmode='browse',
+                                 yscrollcommand=scrollbar.set, **kwargs)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.tree.yview)
 
         self.all_items = []
-        self.filtered_items = []
+        self._lower_items = []  # Lower-cased all_items, for filtering
+        self._keys: List[str] = []  # Key (e.g. an ID) per all_items entry
+        self._key_index: Dict[str, int] = {}  # Key -> all_items index
+        self._shown: List[int] = []  # all_items indexes of the attached rows, in order
+        # Query the list currently shows results for; None after the items change
+        self._search_text: Optional[str] = None
+        # Key select_key just selected, so the event that selection queues is not
+        # taken for a user selection; cleared once pending events have run
+        self._selecting_key: Optional[str] = None
+
+    def set_items(self, items: List[str], keys: Optional[List[str]] = None):
+        """Set the list of items, optionally with a key for each (defaults to the item)"""
+        tree = self.tree
+        if self.all_items:
+            # Includes rows currently detached by the filter
+            tree.delete(*map(str, range(len(self.all_items))))
+        for i, item in enumerate(items):
+            tree.insert('', tk.END, iid=str(i), text=item)
 
-    def set_items(self, items: List[str]):
-        """Set the list of items"""
         self.all_items = items
+        self._keys = items if keys is None else keys
+        self._key_index = {key: i for i, key in enumerate(self._keys)}
+        self._lower_items = [item.lower() for item in items]
+        self._shown = list(range(len(items)))
+        self._search_text = None
         self._update_display()
 
     def _on_search_changed(self, *args):
@@ -47,66 +72,145 @@ class SearchableListbox(tk.Frame):
         self._update_display()
 
     def _update_display(self):
-        """Update the listbox display based on search filter"""
+        """Update which rows are attached based on the search filter"""
         search_text = self.search_var.get().lower()
+        previous = self._search_text
 
         if search_text:
-            self.filtered_items = [
-                item for item in self.all_items
-                if search_text in item.lower()
-            ]
+            lower_items = self._lower_items
+            if previous and search_text.startswith(previous):
+                # Typing more of the query only narrows it; rescan what is shown
+                candidates = self._shown
+            else:
+                candidates = range(len(lower_items))
+            shown = [i for i in candidates if search_text in lower_items[i]]
         else:
-            self.filtered_items = self.all_items.copy()
+            shown = list(range(len(self.all_items)))
+
+        self._search_text = search_text
+        if shown == self._shown and self.all_items:
+            return  # Same rows as already attached
 
-        self.listbox.delete(0, tk.END)
-        for item in self.filtered_items:
-            self.listbox.insert(tk.END, item)
+        self._shown = shown
+        # Attach the matching rows in order and detach the rest, in one call
+        self.tree.set_children('', *map(str, shown))
+
+    def update_item(self, index: int, text: str):
+        """Replace the item at index in all_items, redrawing only its row
+
+        Keeps the selection and scroll position. The item stays in view even if
+        it no longer matches the search until the filter next changes.
+        """
+        self.all_items[index] = text
+        self._lower_items[index] = text.lower()
+        self._search_text = None  # A hidden item may match the next query now
+        self.tree.item(str(index), text=text)
 
     def get_selected(self) -> Optional[str]:
         """Get the currently selected item"""
-        selection = self.listbox.curselection()
+        selection = self.tree.selection()
         if selection:
-            return self.filtered_items[selection[0]]
+            return self.all_items[int(selection[0])]
         return None
 
+    def get_selected_key(self) -> Optional[str]:
+        """Get the key of the currently selected item"""
+        selection = self.tree.selection()
+        if selection:
+            return self._keys[int(selection[0])]
+        return None
+
+    def select_key(self, key: str) -> bool:
+        """Select and scroll to the item with a key, without firing the select callback"""
+        index = self._key_index.get(key)
+        if index is None or index not in self._shown:
+            return False
+        if self._selecting_key is None:
+            # Virtual events are handled before idle callbacks. Some Tk versions
+            # queue no event for an unchanged selection, so don't wait for one.
+            self.after_idle(self._clear_selecting_key)
+        self._selecting_key = key
+        self.tree.selection_set(str(index))
+        self.tree.see(str(index))
+        return True
+
+    def _clear_selecting_key(self):
+        """Stop treating selection events as coming from select_key"""
+        self._selecting_key = None
+
     def bind_select(self, callback: Callable):
-        """Bind a callback to selection changes"""
-        self.listbox.bind('<<ListboxSelect>>', lambda e: callback())
+        """Bind a callback to selection changes made by the user"""
+        def on_select(event):
+            key = self._selecting_key
+            if key is not None and self.get_selected_key() == key:
+                self._selecting_key = None
+                return
+            callback()
+        self.tree.bind('<<TreeviewSelect>>', on_select)
 
 
 class RoomPicker(tk.Toplevel):
-    """Dialog for selecting a room"""
+    """Dialog for selecting a room
+
+    Cancel and the window close button only hide the dialog, so one instance
+    can be kept and re-shown with show() instead of rebuilding its room list.
+    """
 
     def __init__(self, parent, rooms: Dict[str, any], title="Select Room"):
         super().__init__(parent)
         self.title(title)
         self.geometry("400x500")
         self.result = None
+        self._closed = tk.BooleanVar(self, value=False)
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
         # Room list
         self.room_list = SearchableListbox(self, height=15)
         self.room_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Populate rooms
-        room_names = [f"{room.name} ({room_id})" for room_id, room in rooms.items()]
-        self.room_list.set_items(room_names)
-        self.room_ids = list(rooms.keys())
+        self.room_ids = []
+        self.set_rooms(rooms)
 
         # Buttons
         button_frame = tk.Frame(self)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
 
         tk.Button(button_frame, text="Select", command=self._on_select).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Cancel", command=self._on_cancel).pack(side=tk.LEFT, padx=5)
+
+    def set_rooms(self, rooms: Dict[str, any]):
+        """Set the rooms to pick from, repopulating the list only if its labels change"""
+        room_names = [f"{room.name} ({room_id})" for room_id, room in rooms.items()]
+        if room_names != self.room_list.all_items:
+            self.room_ids = list(rooms.keys())
+            self.room_list.set_items(room_names, self.room_ids)
+
+    def show(self) -> Optional[str]:
+        """Show the dialog modally and return the selected room ID, or None"""
+        self.result = None
+        self.room_list.search_var.set("")
+        self.room_list.tree.selection_remove(self.room_list.tree.selection())
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.room_list.search_entry.focus_set()
+        self._closed.set(False)
+        self.wait_variable(self._closed)
+        self.grab_release()
+        self.withdraw()
+        return self.result
 
     def _on_select(self):
         """Handle room selection"""
-        selected = self.room_list.get_selected()
-        if selected:
-            # Extract room ID from display name
-            room_id = selected.split('(')[-1].rstrip(')')
+        room_id = self.room_list.get_selected_key()
+        if room_id:
             self.result = room_id
-            self.destroy()
+            self._closed.set(True)
+
+    def _on_cancel(self):
+        """Hide the dialog without a selection"""
+        self._closed.set(True)
 
 
 class TextEditor(tk.Frame):
@@ -130,16 +234,31 @@ class TextEditor(tk.Frame):
 
         # No horizontal scrollbar needed with word wrapping
 
+    def bind_modified(self, callback: Callable):
+        """Bind a callback to edits of the text (not to set_content)"""
+        def on_modified(event):
+            # The event also fires when the flag is cleared; only act on edits
+            if self.text.edit_modified():
+                self.text.edit_modified(False)
+                callback()
+        self.text.bind('<<Modified>>', on_modified)
+
     def get_content(self) -> str:
         """Get the text content"""
         return self.text.get("1.0", tk.END).rstrip()
 
-    def set_content(self, content: str):
-        """Set the text content"""
+    def set_content(self, content: str, defer_redraw: bool = True):
+        """Set the text content
+
+        The redraw is left to Tk's idle cycle unless defer_redraw is False,
+        so loading many editors in a row renders once.
+        """
         self.text.delete("1.0", tk.END)
         if content:
             self.text.insert("1.0", content)
-        self.text.update_idletasks()  # Force UI update
+        self.text.edit_modified(False)  # Not a user edit
+        if not defer_redraw:
+            self.text.update_idletasks()  # Force UI update
 
 
 class KeyValueEditor(tk.Frame):
@@ -173,46 +292,62 @@ class KeyValueEditor(tk.Frame):
 
         self.tree.bind('<Double-1>', self._edit_pair)
 
+        # Mirror of the tree rows (row id -> (key, value)) so reads don't go through Tcl
+        self._rows: Dict[str, Tuple[str, str]] = {}
+        self._on_changed: Optional[Callable] = None
+
+    def bind_changed(self, callback: Callable):
+        """Bind a callback to pairs being added, edited or removed"""
+        self._on_changed = callback
+
+    def _changed(self):
+        """Notify the bound callback of an edit"""
+        if self._on_changed:
+            self._on_changed()
+
     def _add_pair(self):
         """Add a new key-value pair"""
         dialog = KeyValueDialog(self, "Add Keyword")
         self.wait_window(dialog)
         if dialog.result:
             key, value = dialog.result
-            self.tree.insert('', tk.END, values=(key, value))
+            row = self.tree.insert('', tk.END, values=(key, value))
+            self._rows[row] = (key, value)
+            self._changed()
 
     def _remove_pair(self):
         """Remove selected pair"""
         selection = self.tree.selection()
         if selection:
             self.tree.delete(selection[0])
+            self._rows.pop(selection[0], None)
+            self._changed()
 
     def _edit_pair(self, event):
         """Edit selected pair"""
         selection = self.tree.selection()
         if selection:
-            item = self.tree.item(selection[0])
-            key, value = item['values']
+            key, value = self._rows[selection[0]]
 
             dialog = KeyValueDialog(self, "Edit Keyword", key, value)
             self.wait_window(dialog)
             if dialog.result:
                 new_key, new_value = dialog.result
                 self.tree.item(selection[0], values=(new_key, new_value))
+                self._rows[selection[0]] = (new_key, new_value)
+                self._changed()
 
     def get_pairs(self) -> Dict[str, str]:
         """Get all key-value pairs as dictionary"""
-        result = {}
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            result[values[0]] = values[1]
-        return result
+        return dict(self._rows.values())
 
     def set_pairs(self, pairs: Dict[str, str]):
         """Set key-value pairs from dictionary"""
         self.tree.delete(*self.tree.get_children())
+        self._rows = {}
         for key, value in pairs.items():
-            self.tree.insert('', tk.END, values=(key, value))
+            row = self.tree.insert('', tk.END, values=(key, value))
+            self._rows[row] = (key, value)
 
 
 class KeyValueDialog(tk.Toplevel):
@@ -286,10 +421,13 @@ class ValidationResultsDialog(tk.Toplevel):
         self.results_text = scrolledtext.ScrolledText(text_frame, height=15)
         self.results_text.pack(fill=tk.BOTH, expand=True)
 
-        # Add errors to text
-        for error in errors:
-            level_symbol = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}.get(error.level, '')
-            self.results_text.insert(tk.END, f"{level_symbol} [{error.level.upper()}] {error.category}: {error.message}\n")
+        # Add errors to text in a single insert
+        level_symbols = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}
+        lines = [
+            f"{level_symbols.get(error.level, '')} [{error.level.upper()}] {error.category}: {error.message}\n"
+            for error in errors
+        ]
+        self.results_text.insert(tk.END, "".join(lines))
 
         self.results_text.config(state=tk.DISABLED)
 
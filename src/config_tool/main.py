@@ -45,9 +45,11 @@ class ConfigTool(tk.Tk):
         # NPC editor tab
         self.npc_editor = NPCEditor(self.notebook, self.world_data, self._on_data_changed)
         self.notebook.add(self.npc_editor, text="NPC Editor")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Status bar
         self.status_bar = tk.Label(self, text="Ready", bd=1, relief=tk.SUNKEN, anchor=tk.W)
+        self._status_text = "Ready"
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Load data on startup
@@ -58,40 +60,51 @@ class ConfigTool(tk.Tk):
 
     def _create_menu(self):
         """Create the menu bar"""
+        # (menu label, entries); each entry is (label, command, accelerator) or None
+        # for a separator
+        menus = (
+            ("File", (
+                ("Load", self._load_data, "Ctrl+O"),
+                ("Save", self._save_data, "Ctrl+S"),
+                ("Save As...", self._save_as, None),
+                None,
+                ("Exit", self._on_closing, None),
+            )),
+            ("Edit", (
+                ("Find Room...", self._find_room, "Ctrl+F"),
+                ("Find NPC...", self._find_npc, None),
+            )),
+            ("Tools", (
+                ("Validate All", self._validate_all, "Ctrl+V"),
+                ("Check Connectivity", self._check_connectivity, None),
+                None,
+                ("Import Room...", self._import_room, None),
+                ("Export Room...", self._export_room, None),
+                ("Import NPC...", self._import_npc, None),
+                ("Export NPC...", self._export_npc, None),
+            )),
+            ("Help", (
+                ("About", self._show_about, None),
+            )),
+        )
+
         menubar = tk.Menu(self)
+        for menu_label, entries in menus:
+            menu = tk.Menu(menubar, tearoff=0)
+            for entry in entries:
+                if entry is None:
+                    menu.add_separator()
+                    continue
+                label, command, accelerator = entry
+                if accelerator:
+                    menu.add_command(label=label, command=command, accelerator=accelerator)
+                else:
+                    menu.add_command(label=label, command=command)
+            menubar.add_cascade(label=menu_label, menu=menu)
+
+        # Attach once fully built, so the window lays out the menu bar a single time
         self.config(menu=menubar)
 
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Load", command=self._load_data, accelerator="Ctrl+O")
-        file_menu.add_command(label="Save", command=self._save_data, accelerator="Ctrl+S")
-        file_menu.add_command(label="Save As...", command=self._save_as)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self._on_closing)
-
-        # Edit menu
-        edit_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(label="Find Room...", command=self._find_room, accelerator="Ctrl+F")
-        edit_menu.add_command(label="Find NPC...", command=self._find_npc)
-
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Validate All", command=self._validate_all, accelerator="Ctrl+V")
-        tools_menu.add_command(label="Check Connectivity", command=self._check_connectivity)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="Import Room...", command=self._import_room)
-        tools_menu.add_command(label="Export Room...", command=self._export_room)
-        tools_menu.add_command(label="Import NPC...", command=self._import_npc)
-        tools_menu.add_command(label="Export NPC...", command=self._export_npc)
-
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
-
         # Bind keyboard shortcuts
         self.bind_all("<Control-o>", lambda e: self._load_data())
         self.bind_all("<Control-s>", lambda e: self._save_data())
@@ -103,17 +116,55 @@ class ConfigTool(tk.Tk):
         toolbar = tk.Frame(self, bd=1, relief=tk.RAISED)
         toolbar.pack(side=tk.TOP, fill=tk.X)
 
-        # Toolbar buttons
-        tk.Button(toolbar, text="Load", command=self._load_data).pack(side=tk.LEFT, padx=2)
-        tk.Button(toolbar, text="Save", command=self._save_data).pack(side=tk.LEFT, padx=2)
-        ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        tk.Button(toolbar, text="Validate", command=self._validate_all).pack(side=tk.LEFT, padx=2)
-        ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        tk.Button(toolbar, text="Add Room", command=self._add_room).pack(side=tk.LEFT, padx=2)
-        tk.Button(toolbar, text="Add NPC", command=self._add_npc).pack(side=tk.LEFT, padx=2)
+        # Toolbar buttons; None marks a separator
+        buttons = (
+            ("Load", self._load_data),
+            ("Save", self._save_data),
+            None,
+            ("Validate", self._validate_all),
+            None,
+            ("Add Room", self._add_room),
+            ("Add NPC", self._add_npc),
+        )
+        for button in buttons:
+            if button is None:
+                ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
+            else:
+                text, command = button
+                tk.Button(toolbar, text=text, command=command).pack(side=tk.LEFT, padx=2)
+
+    def _on_tab_changed(self, event=None):
+        """Refresh the newly shown editor if the data changed while it was hidden"""
+        editor = self._current_editor()
+        if editor.needs_refresh:
+            editor.refresh()
+
+    def _current_editor(self):
+        """Get the editor on the selected tab"""
+        if self.notebook.select() == str(self.npc_editor):
+            return self.npc_editor
+        return self.room_editor
+
+    def _refresh_editors(self):
+        """Refresh the visible editor now and the hidden one when it is next shown"""
+        current = self._current_editor()
+        for editor in (self.room_editor, self.npc_editor):
+            if editor is current:
+                editor.refresh()
+            else:
+                editor.needs_refresh = True
 
     def _on_data_changed(self):
         """Called when data is modified"""
+        # The editor being used keeps itself current; the other one catches up when shown
+        current = self._current_editor()
+        for editor in (self.room_editor, self.npc_editor):
+            if editor is not current:
+                editor.needs_refresh = True
+
+        # Fires on every edit; nothing to do if we're already showing the dirty state
+        if self.unsaved_changes and self._status_text == "Modified *":
+            return
         self.unsaved_changes = True
         self._update_status("Modified")
 
@@ -121,10 +172,13 @@ class ConfigTool(tk.Tk):
         """Update the status bar"""
         if self.unsaved_changes:
             message = f"{message} *"
-        self.status_bar.config(text=message)
+        if message != self._status_text:
+            self._status_text = message
+            self.status_bar.config(text=message)
 
     def _load_data(self):
         """Load world data from files"""
+        self.npc_editor.flush_pending_edits()
         if self.unsaved_changes:
             result = messagebox.askyesnocancel(
                 "Unsaved Changes",
@@ -137,8 +191,7 @@ class ConfigTool(tk.Tk):
 
         try:
             self.world_data.load_from_files(self.data_dir)
-            self.room_editor.refresh()
-            self.npc_editor.refresh()
+            self._refresh_editors()
             self.unsaved_changes = False
             self._update_status("Loaded successfully")
         except Exception as e:
@@ -147,6 +200,7 @@ class ConfigTool(tk.Tk):
 
     def _save_data(self):
         """Save world data to files"""
+        self.npc_editor.flush_pending_edits()
         try:
             # Create backups
             zones_file = self.data_dir / 'rooms' / 'zones.yml'
@@ -176,6 +230,7 @@ class ConfigTool(tk.Tk):
 
     def _validate_all(self):
         """Validate all configuration data"""
+        self.npc_editor.flush_pending_edits()
         errors, error_count, warning_count = validate_world_data(self.world_data)
 
         # Show results dialog
@@ -184,14 +239,11 @@ class ConfigTool(tk.Tk):
 
     def _check_connectivity(self):
         """Check room connectivity"""
-        from .utils import find_unreachable_rooms
-
-        all_rooms = self.world_data.get_all_rooms()
-        if not all_rooms:
+        if not self.world_data.get_all_rooms():
             messagebox.showinfo("No Rooms", "No rooms defined")
             return
 
-        unreachable = find_unreachable_rooms(all_rooms)
+        unreachable = self.world_data.find_unreachable_rooms()
 
         if unreachable:
             message = "The following rooms are unreachable:\n\n"
@@ -250,6 +302,7 @@ class ConfigTool(tk.Tk):
 
     def _on_closing(self):
         """Handle window close event"""
+        self.npc_editor.flush_pending_edits()
         if self.unsaved_changes:
             result = messagebox.askyesnocancel(
                 "Unsaved Changes",
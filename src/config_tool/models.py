@@ -1,20 +1,128 @@
 """
 Data models for room and NPC configurations
 """
+import copy
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 import yaml
 from pathlib import Path
 
-
-@dataclass
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+class _WorldLoader(SafeLoader):
+    """SafeLoader limited to the plain tags the room, zone and NPC files use
+
+    Skips the timestamp resolver, so digit-leading scalars (times, years, ids)
+    are not regex-checked as dates, and rejects the binary/set/omap tags.
+    """
+
+
+_WorldLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers
+            if tag != 'tag:yaml.org,2002:timestamp']
+    for first, resolvers in SafeLoader.yaml_implicit_resolvers.items()
+}
+_WorldLoader.yaml_constructors = {
+    tag: constructor for tag, constructor in SafeLoader.yaml_constructors.items()
+    if tag is None or tag.rsplit(':', 1)[-1] in ('null', 'bool', 'int', 'float', 'str', 'seq', 'map')
+}
+
+# Parsed YAML keyed by path, with the (mtime_ns, size) it was parsed at and the
+# content digest; LRU order
+_YAML_CACHE: 'OrderedDict[str, Tuple[Tuple[int, int], bytes, Any]]' = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# All NPC files as one multi-document stream, led by a header of their stamps
+NPC_BUNDLE_FILE = '_all.yml'
+
+# Bump when the pickled model classes change shape. The models define __reduce__
+# so they pickle as constructor calls, which rebuild faster than slot state.
+_SNAPSHOT_VERSION = 4
+
+
+def _load_yaml_cached(path: Path, digests: Optional[Dict] = None) -> Any:
+    """Parse a YAML file, reusing the last parse if the file is unchanged
+
+    Returns a deep copy, since the models keep references into the parsed
+    data and the editors mutate them. If digests is given, the file's content
+    digest and (mtime_ns, size) are recorded in it under the path.
+    """
+    key = str(path)
+    stat = os.stat(key)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _YAML_CACHE.move_to_end(key)
+            digest, data = cached[1], cached[2]
+        else:
+            cached = None
+
+    if cached is None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        data = yaml.load(raw, Loader=_WorldLoader)
+
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = (stamp, digest, data)
+            _YAML_CACHE.move_to_end(key)
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+
+    if digests is not None:
+        digests[key] = (digest, stamp)
+    return copy.deepcopy(data)
+
+
+def _scan_yaml_files(directory: Path) -> List[os.DirEntry]:
+    """List the *.yml files in a directory in one scandir pass (empty if it is missing)"""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it
+                    if entry.name.endswith('.yml') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _dump_yaml(data: Any) -> bytes:
+    """Serialize data as YAML in memory, so each save site issues one write"""
+    return yaml.dump(data, Dumper=SafeDumper, encoding='utf-8',
+                     default_flow_style=False, sort_keys=False)
+
+
+def _load_yaml_files(paths: List[Path], digests: Optional[Dict] = None) -> Dict[Path, Any]:
+    """Parse several YAML files concurrently (file reads overlap), keyed by path"""
+    if len(paths) <= 1:
+        return {path: _load_yaml_cached(path, digests) for path in paths}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return dict(zip(paths, executor.map(lambda path: _load_yaml_cached(path, digests), paths)))
+
+
+@dataclass(slots=True)
 class Exit:
     """Represents a room exit"""
     direction: str
     target_room: str
 
+    def __reduce__(self):
+        return (Exit, (self.direction, self.target_room))
+
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """Represents a room configuration"""
     id: str
@@ -24,6 +132,10 @@ class Room:
     exits: Dict[str, str] = field(default_factory=dict)
     npcs: List[str] = field(default_factory=list)
 
+    def __reduce__(self):
+        return (Room, (self.id, self.name, self.description, self.ascii_art_file, self.exits,
+                       self.npcs))
+
     def to_yaml_dict(self) -> Dict:
         """Convert to YAML-compatible dictionary"""
         data = {
@@ -32,31 +144,35 @@ class Room:
         }
         if self.ascii_art_file:
             data['ascii_art_file'] = self.ascii_art_file
+        # Copies, so a kept result is a snapshot of the room as of this call
         if self.exits:
-            data['exits'] = self.exits
+            data['exits'] = dict(self.exits)
         if self.npcs:
-            data['npcs'] = self.npcs
+            data['npcs'] = list(self.npcs)
         return data
 
     @classmethod
     def from_yaml_dict(cls, room_id: str, data: Dict) -> 'Room':
         """Create Room from YAML dictionary"""
+        get = data.get
         # Handle multiline descriptions - just strip trailing newline
-        description = data.get('description', '')
-        if isinstance(description, str):
+        description = get('description', '')
+        if type(description) is str:
             description = description.strip()
 
+        # `or` only builds the empty default when the key is missing (or null).
+        # Each room gets its own containers since editors mutate them in place.
         return cls(
             id=room_id,
-            name=data.get('name', ''),
+            name=get('name', ''),
             description=description,
-            ascii_art_file=data.get('ascii_art_file'),
-            exits=data.get('exits', {}),
-            npcs=data.get('npcs', [])
+            ascii_art_file=get('ascii_art_file'),
+            exits=get('exits') or {},
+            npcs=get('npcs') or []
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     """Represents a zone configuration"""
     name: str
@@ -64,6 +180,9 @@ class Zone:
     file: str
     rooms: Dict[str, Room] = field(default_factory=dict)
 
+    def __reduce__(self):
+        return (Zone, (self.name, self.description, self.file, self.rooms))
+
     def to_yaml_dict(self) -> Dict:
         """Convert to YAML-compatible dictionary for zones.yml"""
         return {
@@ -82,7 +201,7 @@ class Zone:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NPCDialogue:
     """NPC dialogue configuration"""
     greeting_new: str = ""
@@ -91,6 +210,10 @@ class NPCDialogue:
     player_arrival: str = ""
     player_departure: str = ""
 
+    def __reduce__(self):
+        return (NPCDialogue, (self.greeting_new, self.greeting_return, self.farewell,
+                              self.player_arrival, self.player_departure))
+
     def to_dict(self) -> Dict:
         return {
             'greeting_new': self.greeting_new,
@@ -105,7 +228,7 @@ class NPCDialogue:
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(slots=True)
 class NPCMovement:
     """NPC movement configuration"""
     allowed_rooms: List[str] = field(default_factory=list)
@@ -113,6 +236,10 @@ class NPCMovement:
     movement_probability: float = 0.3
     schedule: Dict[str, str] = field(default_factory=dict)
 
+    def __reduce__(self):
+        return (NPCMovement, (self.allowed_rooms, self.tick_interval, self.movement_probability,
+                              self.schedule))
+
     def to_dict(self) -> Dict:
         data = {
             'allowed_rooms': self.allowed_rooms,
@@ -129,17 +256,20 @@ class NPCMovement:
             allowed_rooms=data.get('allowed_rooms', []),
             tick_interval=data.get('tick_interval', 120),
             movement_probability=data.get('movement_probability', 0.3),
-            schedule=data.get('schedule', {})
+            schedule=data.get('schedule') or {}
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NPCMemory:
     """NPC memory configuration"""
     remember_names: bool = True
     remember_topics: bool = True
     memory_duration: int = 30
 
+    def __reduce__(self):
+        return (NPCMemory, (self.remember_names, self.remember_topics, self.memory_duration))
+
     def to_dict(self) -> Dict:
         return {
             'remember_names': self.remember_names,
@@ -156,13 +286,16 @@ class NPCMemory:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NPCContext:
     """NPC context awareness configuration"""
     time_aware: bool = False
     crowd_aware: bool = False
     crowd_reactions: Dict[str, str] = field(default_factory=dict)
 
+    def __reduce__(self):
+        return (NPCContext, (self.time_aware, self.crowd_aware, self.crowd_reactions))
+
     def to_dict(self) -> Dict:
         data = {
             'time_aware': self.time_aware,
@@ -177,11 +310,11 @@ class NPCContext:
         return cls(
             time_aware=data.get('time_aware', False),
             crowd_aware=data.get('crowd_aware', False),
-            crowd_reactions=data.get('crowd_reactions', {})
+            crowd_reactions=data.get('crowd_reactions') or {}
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     """Represents an NPC configuration"""
     id: str
@@ -195,6 +328,11 @@ class NPC:
     memory: NPCMemory = field(default_factory=NPCMemory)
     context: NPCContext = field(default_factory=NPCContext)
 
+    def __reduce__(self):
+        return (NPC, (self.id, self.name, self.description, self.personality, self.dialogue,
+                      self.keywords, self.movement, self.ambient_actions, self.memory,
+                      self.context))
+
     def to_yaml_dict(self) -> Dict:
         """Convert to YAML-compatible dictionary"""
         data = {
@@ -244,70 +382,102 @@ class WorldData:
         self.zones: Dict[str, Zone] = {}
         self.npcs: Dict[str, NPC] = {}
         self.zone_order: List[str] = []
+        # room_id -> Room across all zones; kept in sync by load_from_files,
+        # add_room and remove_room
+        self._room_index: Dict[str, Room] = {}
+        # npc_id -> ids of the rooms spawning it; built on first use, kept in sync by
+        # add_room, remove_room, set_room_npcs and remove_npc_from_rooms
+        self._npc_rooms: Optional[Dict[str, set]] = None
+        # room_id -> (source room id, direction) of the exits leading to it; built on
+        # first use, kept in sync by add_room, remove_room and the exit methods below
+        self._exit_sources: Optional[Dict[str, set]] = None
+        # zone_id -> ((room_id, room dict) pairs it was dumped from, YAML bytes).
+        # The room dicts are fresh copies, compared by value on the next save.
+        self._zone_yaml: Dict[str, Tuple[Tuple[Tuple[str, Dict], ...], bytes]] = {}
+        # path -> (digest of the YAML last read or written there, its (mtime_ns, size)),
+        # so saving skips files whose content would not change
+        self._file_digests: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
 
     def load_from_files(self, data_dir: Path):
-        """Load world data from YAML files"""
+        """Load world data from YAML files, or their snapshot if it is current"""
         rooms_dir = data_dir / 'rooms'
         npcs_dir = data_dir / 'npcs'
 
-        # Load zones configuration
+        self.zones.clear()
+        self.npcs.clear()
+        self.zone_order.clear()
+        self._room_index.clear()
+        self._npc_rooms = None
+        self._exit_sources = None
+
         zones_file = rooms_dir / 'zones.yml'
-        if zones_file.exists():
-            with open(zones_file) as f:
-                zones_data = yaml.safe_load(f)
-
-                # Handle both list and dict format for zones
-                zones_list = zones_data.get('zones', [])
-                if isinstance(zones_list, list):
-                    # New format: zones is a list
-                    for zone_info in zones_list:
-                        zone_id = zone_info.get('id', zone_info.get('name', '').lower().replace(' ', '_'))
-                        zone = Zone(
-                            name=zone_info.get('name', ''),
-                            description=zone_info.get('description', ''),
-                            file=zone_info.get('file', '')
-                        )
-
-                        # Load zone rooms
-                        zone_file = rooms_dir / zone_info.get('file', '')
-                        if zone_file.exists():
-                            with open(zone_file) as zf:
-                                zone_rooms = yaml.safe_load(zf)
-                                if zone_rooms and 'rooms' in zone_rooms:
-                                    for room_id, room_data in zone_rooms.get('rooms', {}).items():
-                                        zone.rooms[room_id] = Room.from_yaml_dict(room_id, room_data)
-
-                        self.zones[zone_id] = zone
-                        self.zone_order.append(zone_id)
-
-                elif isinstance(zones_list, dict):
-                    # Old format: zones is a dict
-                    for zone_id, zone_info in zones_list.items():
-                        zone = Zone(
-                            name=zone_info.get('name', ''),
-                            description=zone_info.get('description', ''),
-                            file=zone_info.get('file', '')
-                        )
-
-                        # Load zone rooms
-                        zone_file = rooms_dir / zone_info.get('file', '')
-                        if zone_file.exists():
-                            with open(zone_file) as zf:
-                                zone_rooms = yaml.safe_load(zf)
-                                for room_id, room_data in zone_rooms.get('rooms', {}).items():
-                                    zone.rooms[room_id] = Room.from_yaml_dict(room_id, room_data)
-
-                        self.zones[zone_id] = zone
-                        self.zone_order.append(zone_id)
+        zone_entries = self._zone_entries(zones_file)
+        npc_files = self._npc_files(npcs_dir)
+
+        # Stamp exactly the files this load reads, wherever zones.yml points.
+        # Taken before parsing, so a file edited meanwhile fails the next check.
+        stamps = self._source_stamps([zones_file] + [zone_file for _, _, zone_file in zone_entries]
+                                     + npc_files)
+        if self._load_snapshot(data_dir, stamps):
+            return
+
+        npc_docs = self._load_npc_bundle(npcs_dir, npc_files)
+
+        # Parse all zone and NPC files in parallel, then build models on this thread
+        zone_files = [zone_file for _, _, zone_file in zone_entries if zone_file.is_file()]
+        parsed = _load_yaml_files(zone_files + (npc_files if npc_docs is None else []),
+                                  self._file_digests)
+
+        for zone_id, zone_info, zone_file in zone_entries:
+            zone = Zone(
+                name=zone_info.get('name', ''),
+                description=zone_info.get('description', ''),
+                file=zone_info.get('file', '')
+            )
+
+            # Load zone rooms
+            zone_rooms = parsed.get(zone_file)
+            if zone_rooms and 'rooms' in zone_rooms:
+                for room_id, room_data in zone_rooms.get('rooms', {}).items():
+                    room = Room.from_yaml_dict(room_id, room_data)
+                    zone.rooms[room_id] = room
+                    self._room_index[room_id] = room
+
+            self.zones[zone_id] = zone
+            self.zone_order.append(zone_id)
 
         # Load NPCs
-        if npcs_dir.exists():
-            for npc_file in npcs_dir.glob('*.yml'):
-                if npc_file.name != 'npc_schema_template.yml':
-                    with open(npc_file) as f:
-                        npc_data = yaml.safe_load(f)
-                        npc = NPC.from_yaml_dict(npc_data)
-                        self.npcs[npc.id] = npc
+        if npc_docs is None:
+            npc_docs = [parsed[npc_file] for npc_file in npc_files]
+        for npc_data in npc_docs:
+            npc = NPC.from_yaml_dict(npc_data)
+            self.npcs[npc.id] = npc
+
+        self._write_snapshot(data_dir, stamps)
+
+    def _zone_entries(self, zones_file: Path) -> List[Tuple[str, Dict, Path]]:
+        """List (zone_id, zone_info, zone_file) for each zone in zones.yml"""
+        rooms_dir = zones_file.parent
+        zone_entries = []
+        if zones_file.exists():
+            zones_data = _load_yaml_cached(zones_file, self._file_digests)
+
+            # Handle both list and dict format for zones
+            zones_list = zones_data.get('zones', [])
+            if isinstance(zones_list, list):
+                # New format: zones is a list
+                for zone_info in zones_list:
+                    zone_id = zone_info.get('id')
+                    if zone_id is None:
+                        # Legacy entry without an id; save_to_files always writes one
+                        name = zone_info.get('name') or ''
+                        zone_id = name.lower().replace(' ', '_')
+                    zone_entries.append((zone_id, zone_info, rooms_dir / zone_info.get('file', '')))
+            elif isinstance(zones_list, dict):
+                # Old format: zones is a dict
+                for zone_id, zone_info in zones_list.items():
+                    zone_entries.append((zone_id, zone_info, rooms_dir / zone_info.get('file', '')))
+        return zone_entries
 
     def save_to_files(self, data_dir: Path):
         """Save world data to YAML files"""
@@ -341,31 +511,279 @@ class WorldData:
         }
 
         zones_file = rooms_dir / 'zones.yml'
-        with open(zones_file, 'w') as f:
-            yaml.dump(zones_data, f, default_flow_style=False, sort_keys=False)
+        self._write_yaml_if_changed(zones_data, zones_file)
 
-        # Save zone rooms
+        # Save zone rooms, re-dumping only zones with an added, removed or edited room
         for zone_id, zone in self.zones.items():
             zone_file = rooms_dir / zone.file
-            with open(zone_file, 'w') as f:
-                yaml.dump(zone.rooms_to_yaml_dict(), f, default_flow_style=False, sort_keys=False)
+            zone_data = zone.rooms_to_yaml_dict()
+            room_dicts = tuple(zone_data['rooms'].items())
+            cached = self._zone_yaml.get(zone_id)
+            # Comparing the plain dicts is far cheaper than dumping them, and
+            # catches every edit however the room was changed
+            if cached is not None and cached[0] == room_dicts:
+                content = cached[1]
+            else:
+                content = _dump_yaml(zone_data)
+                self._zone_yaml[zone_id] = (room_dicts, content)
+            self._write_if_changed(content, zone_file)
 
         # Save NPCs
         for npc_id, npc in self.npcs.items():
             npc_file = npcs_dir / f"{npc_id}.yml"
-            with open(npc_file, 'w') as f:
-                yaml.dump(npc.to_yaml_dict(), f, default_flow_style=False, sort_keys=False)
+            self._write_yaml_if_changed(npc.to_yaml_dict(), npc_file)
 
-    def get_all_rooms(self) -> Dict[str, Room]:
-        """Get all rooms across all zones"""
-        all_rooms = {}
+        if npcs_dir.exists():
+            self._write_npc_bundle(npcs_dir)
+
+        # No _write_snapshot here: the editor's state need not match the directory
+        # (e.g. a deleted NPC's file is still there), so the next load re-parses
+        # and snapshots what the files actually contain
+
+    @staticmethod
+    def _npc_files(npcs_dir: Path) -> List[Path]:
+        """Get the per-NPC YAML files, skipping the template and _-prefixed files"""
+        return [npcs_dir / entry.name for entry in _scan_yaml_files(npcs_dir)
+                if entry.name != 'npc_schema_template.yml' and entry.name[0] != '_']
+
+    @staticmethod
+    def _npc_file_stamps(npc_files: List[Path]) -> Dict[str, List[int]]:
+        """Get [mtime_ns, size] for each NPC file, keyed by file name"""
+        stamps = {}
+        for npc_file in npc_files:
+            stat = npc_file.stat()
+            stamps[npc_file.name] = [stat.st_mtime_ns, stat.st_size]
+        return stamps
+
+    def _load_npc_bundle(self, npcs_dir: Path, npc_files: List[Path]) -> Optional[List[Dict]]:
+        """Read every NPC from the bundle in one pass, if it matches the NPC files
+
+        The header must stamp exactly the NPC files on disk, so a file the bundle
+        does not contain (e.g. left behind by a deleted NPC) forces a real parse.
+        """
+        try:
+            with open(npcs_dir / NPC_BUNDLE_FILE, 'rb') as f:
+                header, *docs = yaml.load_all(f, Loader=_WorldLoader)
+        except (OSError, ValueError, yaml.YAMLError):
+            return None
+
+        if not isinstance(header, dict) or header.get('sources') != self._npc_file_stamps(npc_files):
+            return None
+        return docs
+
+    def _write_npc_bundle(self, npcs_dir: Path):
+        """Write the NPC bundle, stamped with the files of the NPCs it contains"""
+        # Only the files just written for self.npcs: stamping every file on disk
+        # would let the bundle stand in for NPC files it does not contain
+        npc_files = [npcs_dir / f"{npc_id}.yml" for npc_id in self.npcs]
+        header = {'sources': self._npc_file_stamps(npc_files)}
+        docs = [header] + [npc.to_yaml_dict() for npc in self.npcs.values()]
+        content = yaml.dump_all(docs, Dumper=SafeDumper, encoding='utf-8', explicit_start=True,
+                                default_flow_style=False, sort_keys=False)
+        self._write_if_changed(content, npcs_dir / NPC_BUNDLE_FILE)
+
+    def _write_yaml_if_changed(self, data: Any, path: Path):
+        """Write data as YAML unless it matches what we last wrote and the file is untouched"""
+        self._write_if_changed(_dump_yaml(data), path)
+
+    def _write_if_changed(self, content: bytes, path: Path):
+        """Write content unless it matches what we last wrote and the file is untouched"""
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+
+        key = str(path)
+        try:
+            stat = os.stat(key)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if self._file_digests.get(key) == (digest, stamp):
+            return
+
+        path.write_bytes(content)
+        stat = os.stat(key)
+        self._file_digests[key] = (digest, (stat.st_mtime_ns, stat.st_size))
+
+    @staticmethod
+    def _snapshot_path(data_dir: Path) -> Path:
+        """Get the path of the pickled world snapshot"""
+        return data_dir / '.cache' / 'world.pkl'
+
+    @staticmethod
+    def _source_stamps(paths: List[Path]) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Get (mtime_ns, size) for each file the world is loaded from, None if missing"""
+        stamps = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stamps[str(path)] = None
+            else:
+                stamps[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def _load_snapshot(self, data_dir: Path, source_stamps: Dict) -> bool:
+        """Load the pickled snapshot if it was taken from files with these stamps"""
+        try:
+            with open(self._snapshot_path(data_dir), 'rb') as f:
+                version, stamps, zones, zone_order, npcs, digests = pickle.load(f)
+        except Exception:
+            return False
+
+        if version != _SNAPSHOT_VERSION or stamps != source_stamps:
+            return False
+
+        self.zones.update(zones)
+        self.zone_order.extend(zone_order)
+        self.npcs.update(npcs)
+        self._file_digests.update(digests)
         for zone in self.zones.values():
-            all_rooms.update(zone.rooms)
-        return all_rooms
+            self._room_index.update(zone.rooms)
+        return True
+
+    def _write_snapshot(self, data_dir: Path, stamps: Dict):
+        """Pickle the loaded world next to the YAML so unchanged data skips parsing
+
+        Only call this right after parsing the files, with their stamps from
+        before the parse, so the snapshot holds exactly what they contain.
+        """
+        path = self._snapshot_path(data_dir)
+        # Digests still matching the files on disk, so a save after a snapshot load can skip them
+        digests = {key: entry for key, entry in self._file_digests.items()
+                   if stamps.get(key) == entry[1]}
+        snapshot = (_SNAPSHOT_VERSION, stamps, self.zones, self.zone_order, self.npcs, digests)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=5)
+        except OSError:
+            pass  # The snapshot is only an optimisation
+
+    def get_all_rooms(self) -> Mapping[str, Room]:
+        """Get all rooms across all zones (a read-only view)"""
+        return MappingProxyType(self._room_index)
 
     def get_room_by_id(self, room_id: str) -> Optional[Room]:
         """Find a room by ID across all zones"""
-        for zone in self.zones.values():
-            if room_id in zone.rooms:
-                return zone.rooms[room_id]
-        return None
\ No newline at end of file
+        return self._room_index.get(room_id)
+
+    def add_room(self, zone: Zone, room: Room):
+        """Add a room to a zone"""
+        zone.rooms[room.id] = room
+        self._room_index[room.id] = room
+        if self._npc_rooms is not None:
+            for npc_id in room.npcs:
+                self._npc_rooms.setdefault(npc_id, set()).add(room.id)
+        if self._exit_sources is not None:
+            for direction, target in room.exits.items():
+                self._exit_sources.setdefault(target, set()).add((room.id, direction))
+
+    def remove_room(self, zone: Zone, room_id: str):
+        """Remove a room from a zone"""
+        room = zone.rooms.pop(room_id)
+        self._room_index.pop(room_id, None)
+        if self._npc_rooms is not None:
+            for npc_id in room.npcs:
+                self._npc_rooms.get(npc_id, set()).discard(room_id)
+        if self._exit_sources is not None:
+            for direction, target in room.exits.items():
+                self._exit_sources.get(target, set()).discard((room_id, direction))
+
+    def _get_npc_rooms(self) -> Dict[str, set]:
+        """Get the npc_id -> room ids index, building it if needed"""
+        if self._npc_rooms is None:
+            npc_rooms: Dict[str, set] = {}
+            for room_id, room in self._room_index.items():
+                for npc_id in room.npcs:
+                    npc_rooms.setdefault(npc_id, set()).add(room_id)
+            self._npc_rooms = npc_rooms
+        return self._npc_rooms
+
+    def rooms_containing_npc(self, npc_id: str) -> List[Room]:
+        """Get the rooms whose spawn list includes an NPC"""
+        return [self._room_index[room_id] for room_id in self._get_npc_rooms().get(npc_id, ())]
+
+    def set_room_npcs(self, room: Room, npc_ids: List[str]):
+        """Replace a room's spawn list"""
+        npc_rooms = self._get_npc_rooms()
+        for npc_id in room.npcs:
+            npc_rooms.get(npc_id, set()).discard(room.id)
+        for npc_id in npc_ids:
+            npc_rooms.setdefault(npc_id, set()).add(room.id)
+        room.npcs = npc_ids
+
+    def remove_npc_from_rooms(self, npc_id: str):
+        """Remove an NPC from every room spawn list"""
+        for room_id in self._get_npc_rooms().pop(npc_id, ()):
+            room = self._room_index[room_id]
+            room.npcs = [room_npc for room_npc in room.npcs if room_npc != npc_id]
+
+    def _get_exit_sources(self) -> Dict[str, set]:
+        """Get the room_id -> (source room id, direction) index, building it if needed"""
+        if self._exit_sources is None:
+            exit_sources: Dict[str, set] = {}
+            for room_id, room in self._room_index.items():
+                for direction, target in room.exits.items():
+                    exit_sources.setdefault(target, set()).add((room_id, direction))
+            self._exit_sources = exit_sources
+        return self._exit_sources
+
+    def set_exit(self, room: Room, direction: str, target_id: str):
+        """Add or replace one of a room's exits"""
+        exit_sources = self._get_exit_sources()
+        old_target = room.exits.get(direction)
+        if old_target is not None:
+            exit_sources.get(old_target, set()).discard((room.id, direction))
+        exit_sources.setdefault(target_id, set()).add((room.id, direction))
+        room.exits[direction] = target_id
+
+    def remove_exit(self, room: Room, direction: str):
+        """Remove one of a room's exits"""
+        target_id = room.exits.pop(direction)
+        self._get_exit_sources().get(target_id, set()).discard((room.id, direction))
+
+    def remove_exits_to(self, room_id: str):
+        """Remove every exit leading to a room"""
+        for source_id, direction in self._get_exit_sources().pop(room_id, ()):
+            room = self._room_index.get(source_id)
+            if room is not None and room.exits.get(direction) == room_id:
+                del room.exits[direction]
+
+    def build_adjacency(self) -> Tuple[List[int], List[int], Dict[str, int]]:
+        """Build a CSR-style adjacency list of the room graph
+
+        Returns (indptr, indices, index): room i's exits lead to rooms
+        indices[indptr[i]:indptr[i + 1]], and index maps room IDs to i.
+        Exits to unknown rooms are left out.
+        """
+        index = {room_id: i for i, room_id in enumerate(self._room_index)}
+        indptr = [0]
+        indices: List[int] = []
+        for room in self._room_index.values():
+            for target in room.exits.values():
+                target_index = index.get(target)
+                if target_index is not None:
+                    indices.append(target_index)
+            indptr.append(len(indices))
+        return indptr, indices, index
+
+    def find_unreachable_rooms(self, start_room: str = 'alamo_plaza') -> List[str]:
+        """Find rooms that cannot be reached from the starting room"""
+        indptr, indices, index = self.build_adjacency()
+        start = index.get(start_room)
+        if start is None:
+            return []
+
+        # Breadth-first over room indices with a flat visited array
+        visited = bytearray(len(index))
+        visited[start] = 1
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                for target in indices[indptr[current]:indptr[current + 1]]:
+                    if not visited[target]:
+                        visited[target] = 1
+                        next_frontier.append(target)
+            frontier = next_frontier
+
+        return [room_id for room_id, i in index.items() if not visited[i]]
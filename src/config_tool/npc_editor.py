@@ -1,8 +1,10 @@
 """
 NPC editor with property panels
 """
+import copy
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from functools import partial
 from typing import Callable, List
 
 from .models import NPC, NPCDialogue, NPCMovement, NPCMemory, NPCContext
@@ -18,6 +20,19 @@ class NPCEditor(tk.Frame):
         self.world_data = world_data
         self.on_change = on_change_callback
         self.current_npc = None
+        # Set by the main window when the data changes while this tab is hidden
+        self.needs_refresh = False
+
+        # Property edits are written back in one batch once typing pauses;
+        # _pending_writes holds the writer of each edited field (dict as ordered set)
+        self._dirty_after_id = None
+        self._pending_writes = {}
+        self._populating = False  # True while _update_properties fills the widgets
+        self._npc_index = {}  # NPC id -> position in the NPC list
+        self._display_names = {}  # NPC id -> formatted list label; see _display_name
+        # Field key -> value last put into its widget; cleared on any user edit
+        self._displayed = {}
+        self._room_picker = None  # Created on first use, then re-shown
 
         self._create_ui()
         self.refresh()
@@ -52,18 +67,58 @@ class NPCEditor(tk.Frame):
         self.prop_notebook = ttk.Notebook(right_panel)
         self.prop_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Create tabs
-        self._create_basic_tab()
-        self._create_dialogue_tab()
-        self._create_keywords_tab()
-        self._create_movement_tab()
-        self._create_ambient_tab()
-        self._create_memory_tab()
-
-    def _create_basic_tab(self):
+        # Create tabs. Only Basic is built up front; the others get an empty
+        # frame and their widgets are created the first time they are shown.
+        # Tab text -> (builder, filler)
+        self._tab_specs = {
+            "Basic": (self._create_basic_tab, self._fill_basic_tab),
+            "Dialogue": (self._create_dialogue_tab, self._fill_dialogue_tab),
+            "Keywords": (self._create_keywords_tab, self._fill_keywords_tab),
+            "Movement": (self._create_movement_tab, self._fill_movement_tab),
+            "Ambient": (self._create_ambient_tab, self._fill_ambient_tab),
+            "Memory/Context": (self._create_memory_tab, self._fill_memory_tab),
+        }
+        self._tab_frames = {}
+        self._built_tabs = {}  # Tab text -> filler, for tabs whose widgets exist
+        self._stale_tabs = set()  # Built tabs still showing a previously selected NPC
+        for text in self._tab_specs:
+            frame = tk.Frame(self.prop_notebook)
+            self.prop_notebook.add(frame, text=text)
+            self._tab_frames[text] = frame
+        self._build_tab("Basic")
+        self.prop_notebook.bind('<<NotebookTabChanged>>', self._on_prop_tab_changed)
+
+    def _selected_tab(self) -> str:
+        """Get the text of the selected property tab"""
+        return self.prop_notebook.tab(self.prop_notebook.select(), 'text')
+
+    def _on_prop_tab_changed(self, event=None):
+        """Build a property tab the first time it is selected, or catch it up"""
+        text = self._selected_tab()
+        if text not in self._built_tabs:
+            self._build_tab(text)
+        elif text in self._stale_tabs and self.current_npc:
+            self._stale_tabs.discard(text)
+            self._populating = True
+            try:
+                self._built_tabs[text]()
+            finally:
+                self._populating = False
+
+    def _build_tab(self, text: str):
+        """Create a property tab's widgets and show the current NPC in them"""
+        build, fill = self._tab_specs[text]
+        build(self._tab_frames[text])
+        self._built_tabs[text] = fill
+        if self.current_npc:
+            self._populating = True
+            try:
+                fill()
+            finally:
+                self._populating = False
+
+    def _create_basic_tab(self, basic_frame: tk.Frame):
         """Create basic properties tab"""
-        basic_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(basic_frame, text="Basic")
 
         # NPC ID
         tk.Label(basic_frame, text="NPC ID:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
@@ -76,11 +131,12 @@ class NPCEditor(tk.Frame):
         self.name_var = tk.StringVar()
         self.name_entry = tk.Entry(basic_frame, textvariable=self.name_var)
         self.name_entry.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.name_var.trace_add('write', lambda *args: self._on_property_changed())
+        self.name_var.trace_add('write', lambda *args: self._mark_dirty(self._write_name))
 
         # Description
         tk.Label(basic_frame, text="Description:").grid(row=2, column=0, sticky=tk.NW, padx=5, pady=5)
         self.desc_text = TextEditor(basic_frame, height=6)
+        self.desc_text.bind_modified(lambda: self._mark_dirty(self._write_description))
         self.desc_text.grid(row=2, column=1, sticky=tk.NSEW, padx=5, pady=5)
 
         # Personality
@@ -88,72 +144,62 @@ class NPCEditor(tk.Frame):
         self.personality_var = tk.StringVar()
         self.personality_entry = tk.Entry(basic_frame, textvariable=self.personality_var)
         self.personality_entry.grid(row=3, column=1, sticky=tk.EW, padx=5, pady=5)
-        self.personality_var.trace_add('write', lambda *args: self._on_property_changed())
+        self.personality_var.trace_add('write', lambda *args: self._mark_dirty(self._write_personality))
 
         basic_frame.grid_columnconfigure(1, weight=1)
         basic_frame.grid_rowconfigure(2, weight=1)
 
-    def _create_dialogue_tab(self):
+    def _create_dialogue_tab(self, dialogue_frame: tk.Frame):
         """Create dialogue tab"""
-        dialogue_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(dialogue_frame, text="Dialogue")
-
-        # Create scrollable frame
-        canvas = tk.Canvas(dialogue_frame)
-        scrollbar = tk.Scrollbar(dialogue_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Dialogue fields
-        tk.Label(scrollable_frame, text="Greeting (New Player):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.greeting_new_text = TextEditor(scrollable_frame, height=3)
+        # Dialogue fields; the five short editors fit without a scrolling canvas
+        tk.Label(dialogue_frame, text="Greeting (New Player):").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.greeting_new_text = TextEditor(dialogue_frame, height=3)
         self.greeting_new_text.grid(row=0, column=1, sticky=tk.EW, padx=5, pady=5)
 
-        tk.Label(scrollable_frame, text="Greeting (Return):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.greeting_return_text = TextEditor(scrollable_frame, height=3)
+        tk.Label(dialogue_frame, text="Greeting (Return):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
+        self.greeting_return_text = TextEditor(dialogue_frame, height=3)
         self.greeting_return_text.grid(row=1, column=1, sticky=tk.EW, padx=5, pady=5)
 
-        tk.Label(scrollable_frame, text="Farewell:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.farewell_text = TextEditor(scrollable_frame, height=3)
+        tk.Label(dialogue_frame, text="Farewell:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.farewell_text = TextEditor(dialogue_frame, height=3)
         self.farewell_text.grid(row=2, column=1, sticky=tk.EW, padx=5, pady=5)
 
-        tk.Label(scrollable_frame, text="Player Arrival:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        self.player_arrival_text = TextEditor(scrollable_frame, height=3)
+        tk.Label(dialogue_frame, text="Player Arrival:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.player_arrival_text = TextEditor(dialogue_frame, height=3)
         self.player_arrival_text.grid(row=3, column=1, sticky=tk.EW, padx=5, pady=5)
 
-        tk.Label(scrollable_frame, text="Player Departure:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        self.player_departure_text = TextEditor(scrollable_frame, height=3)
+        tk.Label(dialogue_frame, text="Player Departure:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.player_departure_text = TextEditor(dialogue_frame, height=3)
         self.player_departure_text.grid(row=4, column=1, sticky=tk.EW, padx=5, pady=5)
 
-        tk.Label(scrollable_frame, text="Use {player} for player name", fg="gray").grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
+        # Dialogue attribute -> editor
+        self.dialogue_editors = {
+            'greeting_new': self.greeting_new_text,
+            'greeting_return': self.greeting_return_text,
+            'farewell': self.farewell_text,
+            'player_arrival': self.player_arrival_text,
+            'player_departure': self.player_departure_text,
+        }
+        for attr, editor in self.dialogue_editors.items():
+            write = partial(self._write_dialogue, attr)
+            editor.bind_modified(lambda write=write: self._mark_dirty(write))
 
-        scrollable_frame.grid_columnconfigure(1, weight=1)
+        tk.Label(dialogue_frame, text="Use {player} for player name", fg="gray").grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        dialogue_frame.grid_columnconfigure(1, weight=1)
 
-    def _create_keywords_tab(self):
+    def _create_keywords_tab(self, keywords_frame: tk.Frame):
         """Create keywords tab"""
-        keywords_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(keywords_frame, text="Keywords")
 
         tk.Label(keywords_frame, text="Keywords and Responses:").pack(anchor=tk.W, padx=5, pady=5)
         tk.Label(keywords_frame, text="Use | to separate keyword alternatives (e.g., 'hello|hi|greetings')", fg="gray").pack(anchor=tk.W, padx=5)
 
         self.keywords_editor = KeyValueEditor(keywords_frame)
         self.keywords_editor.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.keywords_editor.bind_changed(lambda: self._mark_dirty(self._write_keywords))
 
-    def _create_movement_tab(self):
+    def _create_movement_tab(self, movement_frame: tk.Frame):
         """Create movement tab"""
-        movement_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(movement_frame, text="Movement")
 
         # Movement settings
         settings_frame = tk.LabelFrame(movement_frame, text="Movement Settings")
@@ -163,11 +209,13 @@ class NPCEditor(tk.Frame):
         self.tick_interval_var = tk.IntVar(value=120)
         self.tick_interval_spin = tk.Spinbox(settings_frame, from_=30, to=600, textvariable=self.tick_interval_var)
         self.tick_interval_spin.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
+        self.tick_interval_var.trace_add('write', lambda *args: self._mark_dirty(self._write_tick_interval))
 
         tk.Label(settings_frame, text="Movement Probability:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
         self.movement_prob_var = tk.DoubleVar(value=0.3)
         self.movement_prob_spin = tk.Spinbox(settings_frame, from_=0.0, to=1.0, increment=0.1, textvariable=self.movement_prob_var)
         self.movement_prob_spin.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
+        self.movement_prob_var.trace_add('write', lambda *args: self._mark_dirty(self._write_movement_probability))
 
         # Allowed rooms
         rooms_frame = tk.LabelFrame(movement_frame, text="Allowed Rooms")
@@ -194,24 +242,23 @@ class NPCEditor(tk.Frame):
             entry = tk.Entry(schedule_frame, textvariable=var)
             entry.grid(row=i, column=1, sticky=tk.EW, padx=5, pady=2)
             self.schedule_entries[time_slot] = var
+            write = partial(self._write_schedule, time_slot)
+            var.trace_add('write', lambda *args, write=write: self._mark_dirty(write))
 
         schedule_frame.grid_columnconfigure(1, weight=1)
 
-    def _create_ambient_tab(self):
+    def _create_ambient_tab(self, ambient_frame: tk.Frame):
         """Create ambient actions tab"""
-        ambient_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(ambient_frame, text="Ambient")
 
         tk.Label(ambient_frame, text="Ambient Actions (one per line):").pack(anchor=tk.W, padx=5, pady=5)
         self.ambient_text = TextEditor(ambient_frame, height=10)
         self.ambient_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.ambient_text.bind_modified(lambda: self._mark_dirty(self._write_ambient))
 
         tk.Label(ambient_frame, text="These actions will be randomly displayed periodically", fg="gray").pack(anchor=tk.W, padx=5, pady=5)
 
-    def _create_memory_tab(self):
+    def _create_memory_tab(self, memory_frame: tk.Frame):
         """Create memory/context tab"""
-        memory_frame = tk.Frame(self.prop_notebook)
-        self.prop_notebook.add(memory_frame, text="Memory/Context")
 
         # Memory settings
         memory_group = tk.LabelFrame(memory_frame, text="Memory Settings")
@@ -225,6 +272,8 @@ class NPCEditor(tk.Frame):
 
         tk.Label(memory_group, text="Memory duration (days):").pack(side=tk.LEFT, padx=5, pady=5)
         self.memory_duration_var = tk.IntVar(value=30)
+        for var in (self.remember_names_var, self.remember_topics_var, self.memory_duration_var):
+            var.trace_add('write', lambda *args: self._mark_dirty(self._write_memory))
         tk.Spinbox(memory_group, from_=1, to=365, textvariable=self.memory_duration_var).pack(side=tk.LEFT, padx=5, pady=5)
 
         # Context awareness
@@ -236,6 +285,8 @@ class NPCEditor(tk.Frame):
 
         self.crowd_aware_var = tk.BooleanVar(value=False)
         tk.Checkbutton(context_group, text="Crowd aware (responds differently based on room population)", variable=self.crowd_aware_var).pack(anchor=tk.W, padx=5, pady=2)
+        for var in (self.time_aware_var, self.crowd_aware_var):
+            var.trace_add('write', lambda *args: self._mark_dirty(self._write_context))
 
         # Crowd reactions
         crowd_frame = tk.LabelFrame(memory_frame, text="Crowd Reactions")
@@ -248,135 +299,259 @@ class NPCEditor(tk.Frame):
             entry = tk.Entry(crowd_frame, textvariable=var)
             entry.grid(row=i, column=1, sticky=tk.EW, padx=5, pady=2)
             self.crowd_reaction_entries[crowd_level] = var
+            write = partial(self._write_crowd_reaction, crowd_level)
+            var.trace_add('write', lambda *args, write=write: self._mark_dirty(write))
 
         crowd_frame.grid_columnconfigure(1, weight=1)
 
     def refresh(self):
         """Refresh the display"""
+        self.needs_refresh = False
+        self._display_names.clear()  # The NPCs may have been reloaded
         self._update_npc_list()
 
     def _update_npc_list(self):
         """Update the NPC list"""
-        npc_names = [format_npc_display_name(npc) for npc in self.world_data.npcs.values()]
-        self.npc_list.set_items(npc_names)
+        npcs = self.world_data.npcs
+        self._npc_index = {npc_id: i for i, npc_id in enumerate(npcs)}
+        npc_names = [self._display_name(npc) for npc in npcs.values()]
+        self.npc_list.set_items(npc_names, list(npcs))
+
+    def _display_name(self, npc) -> str:
+        """Get an NPC's list label, formatting it only when not cached"""
+        name = self._display_names.get(npc.id)
+        if name is None:
+            name = self._display_names[npc.id] = format_npc_display_name(npc)
+        return name
 
     def _on_npc_selected(self):
         """Handle NPC selection"""
-        selected = self.npc_list.get_selected()
-        if selected:
-            # Extract NPC ID from display name
-            npc_id = selected.split('(')[-1].rstrip(')')
-            if npc_id in self.world_data.npcs:
-                self.current_npc = self.world_data.npcs[npc_id]
-                self._update_properties()
+        npc_id = self.npc_list.get_selected_key()
+        if npc_id in self.world_data.npcs:
+            self.flush_pending_edits()
+            self.current_npc = self.world_data.npcs[npc_id]
+            self._update_properties()
 
     def _update_properties(self):
         """Update property fields with current NPC data"""
         if not self.current_npc:
             return
 
-        # Basic properties
-        self.id_var.set(self.current_npc.id)
-        self.name_var.set(self.current_npc.name)
-        self.desc_text.set_content(self.current_npc.description)
-        self.personality_var.set(self.current_npc.personality)
-
-        # Dialogue
-        self.greeting_new_text.set_content(self.current_npc.dialogue.greeting_new)
-        self.greeting_return_text.set_content(self.current_npc.dialogue.greeting_return)
-        self.farewell_text.set_content(self.current_npc.dialogue.farewell)
-        self.player_arrival_text.set_content(self.current_npc.dialogue.player_arrival)
-        self.player_departure_text.set_content(self.current_npc.dialogue.player_departure)
-
-        # Keywords
-        self.keywords_editor.set_pairs(self.current_npc.keywords)
-
-        # Movement
-        self.tick_interval_var.set(self.current_npc.movement.tick_interval)
-        self.movement_prob_var.set(self.current_npc.movement.movement_probability)
+        # Filling the widgets fires their traces; that is not an edit
+        self._discard_pending_edits()
+        self._populating = True
+        try:
+            self._fill_properties()
+        finally:
+            self._populating = False
+
+    def _fill_properties(self):
+        """Copy current NPC data into the selected property tab
+
+        Other built tabs are only marked stale and filled when next selected,
+        so switching NPCs touches one tab's widgets rather than all of them.
+        """
+        selected = self._selected_tab()
+        for text, fill in self._built_tabs.items():
+            if text == selected:
+                fill()
+            else:
+                self._stale_tabs.add(text)
+        self._stale_tabs.discard(selected)
+
+    def _show(self, key, value, show: Callable):
+        """Call show(value) unless the widget for key already displays value
+
+        Browsing between similar NPCs then skips the widget writes (and the
+        traces and redraws they cause) for fields that are the same.
+        """
+        displayed = self._displayed
+        if key in displayed and displayed[key] == value:
+            return
+        show(value)
+        displayed[key] = value
+
+    def _fill_basic_tab(self):
+        """Show the current NPC's basic properties"""
+        npc = self.current_npc
+        self._show('id', npc.id, self.id_var.set)
+        self._show('name', npc.name, self.name_var.set)
+        self._show('description', npc.description, self.desc_text.set_content)
+        self._show('personality', npc.personality, self.personality_var.set)
+
+    def _fill_dialogue_tab(self):
+        """Show the current NPC's dialogue"""
+        for attr, editor in self.dialogue_editors.items():
+            self._show(attr, getattr(self.current_npc.dialogue, attr), editor.set_content)
+
+    def _fill_keywords_tab(self):
+        """Show the current NPC's keywords"""
+        self._show('keywords', dict(self.current_npc.keywords), self.keywords_editor.set_pairs)
+
+    def _fill_movement_tab(self):
+        """Show the current NPC's movement settings, allowed rooms and schedule"""
+        movement = self.current_npc.movement
+        self._show('tick_interval', movement.tick_interval, self.tick_interval_var.set)
+        self._show('movement_probability', movement.movement_probability, self.movement_prob_var.set)
 
         # Allowed rooms
-        self.allowed_rooms_listbox.delete(0, tk.END)
-        for room_id in self.current_npc.movement.allowed_rooms:
-            self.allowed_rooms_listbox.insert(tk.END, room_id)
+        self._show('allowed_rooms', tuple(movement.allowed_rooms), self._show_allowed_rooms)
 
         # Schedule
         for time_slot, var in self.schedule_entries.items():
-            var.set(self.current_npc.movement.schedule.get(time_slot, ""))
+            self._show(('schedule', time_slot), movement.schedule.get(time_slot, ""), var.set)
 
-        # Ambient actions
+    def _show_allowed_rooms(self, rooms):
+        """Fill the allowed-rooms listbox in one insert"""
+        self.allowed_rooms_listbox.delete(0, tk.END)
+        if rooms:
+            self.allowed_rooms_listbox.insert(tk.END, *rooms)
+
+    def _fill_ambient_tab(self):
+        """Show the current NPC's ambient actions"""
         ambient_text = "\n".join(self.current_npc.ambient_actions)
-        self.ambient_text.set_content(ambient_text)
+        self._show('ambient_actions', ambient_text, self.ambient_text.set_content)
 
+    def _fill_memory_tab(self):
+        """Show the current NPC's memory and context settings"""
         # Memory
-        self.remember_names_var.set(self.current_npc.memory.remember_names)
-        self.remember_topics_var.set(self.current_npc.memory.remember_topics)
-        self.memory_duration_var.set(self.current_npc.memory.memory_duration)
+        memory = self.current_npc.memory
+        self._show('remember_names', memory.remember_names, self.remember_names_var.set)
+        self._show('remember_topics', memory.remember_topics, self.remember_topics_var.set)
+        self._show('memory_duration', memory.memory_duration, self.memory_duration_var.set)
 
         # Context
-        self.time_aware_var.set(self.current_npc.context.time_aware)
-        self.crowd_aware_var.set(self.current_npc.context.crowd_aware)
+        context = self.current_npc.context
+        self._show('time_aware', context.time_aware, self.time_aware_var.set)
+        self._show('crowd_aware', context.crowd_aware, self.crowd_aware_var.set)
 
         # Crowd reactions
         for crowd_level, var in self.crowd_reaction_entries.items():
-            var.set(self.current_npc.context.crowd_reactions.get(crowd_level, ""))
+            self._show(('crowd', crowd_level), context.crowd_reactions.get(crowd_level, ""), var.set)
 
-    def _on_property_changed(self):
-        """Handle property changes"""
-        if not self.current_npc:
+    def _mark_dirty(self, write: Callable):
+        """Queue a field's writer and (re)start the idle timer that runs it"""
+        if self._populating or not self.current_npc:
+            return
+        self._displayed.clear()  # A widget no longer shows what we put there
+        self._pending_writes[write] = None
+        if self._dirty_after_id is not None:
+            self.after_cancel(self._dirty_after_id)
+        self._dirty_after_id = self.after(150, self._flush_dirty)
+
+    def flush_pending_edits(self):
+        """Write back pending edits now (before saving, or switching NPCs)"""
+        if self._dirty_after_id is not None:
+            self.after_cancel(self._dirty_after_id)
+            self._flush_dirty()
+
+    def _discard_pending_edits(self):
+        """Drop pending edits without writing them"""
+        if self._dirty_after_id is not None:
+            self.after_cancel(self._dirty_after_id)
+            self._dirty_after_id = None
+        self._pending_writes.clear()
+
+    def _flush_dirty(self):
+        """Write the edited fields back to the NPC"""
+        self._dirty_after_id = None
+        pending, self._pending_writes = self._pending_writes, {}
+        if not pending or not self.current_npc:
             return
 
-        # Update NPC data
-        self.current_npc.name = self.name_var.get()
-        self.current_npc.description = self.desc_text.get_content()
-        self.current_npc.personality = self.personality_var.get()
-
-        # Dialogue
-        self.current_npc.dialogue.greeting_new = self.greeting_new_text.get_content()
-        self.current_npc.dialogue.greeting_return = self.greeting_return_text.get_content()
-        self.current_npc.dialogue.farewell = self.farewell_text.get_content()
-        self.current_npc.dialogue.player_arrival = self.player_arrival_text.get_content()
-        self.current_npc.dialogue.player_departure = self.player_departure_text.get_content()
-
-        # Keywords
-        self.current_npc.keywords = self.keywords_editor.get_pairs()
-
-        # Movement
-        self.current_npc.movement.tick_interval = self.tick_interval_var.get()
-        self.current_npc.movement.movement_probability = self.movement_prob_var.get()
-
-        # Schedule
-        schedule = {}
-        for time_slot, var in self.schedule_entries.items():
-            value = var.get().strip()
-            if value:
-                schedule[time_slot] = value
-        self.current_npc.movement.schedule = schedule
-
-        # Ambient actions
-        ambient_text = self.ambient_text.get_content()
-        self.current_npc.ambient_actions = [line.strip() for line in ambient_text.split('\n') if line.strip()]
-
-        # Memory
-        self.current_npc.memory.remember_names = self.remember_names_var.get()
-        self.current_npc.memory.remember_topics = self.remember_topics_var.get()
-        self.current_npc.memory.memory_duration = self.memory_duration_var.get()
-
-        # Context
-        self.current_npc.context.time_aware = self.time_aware_var.get()
-        self.current_npc.context.crowd_aware = self.crowd_aware_var.get()
-
-        # Crowd reactions
-        crowd_reactions = {}
-        for crowd_level, var in self.crowd_reaction_entries.items():
-            value = var.get().strip()
-            if value:
-                crowd_reactions[crowd_level] = value
-        self.current_npc.context.crowd_reactions = crowd_reactions
+        # Writers report whether the NPC actually changed, e.g. not for an
+        # edit that was typed and then undone before the timer fired
+        changed = [write() for write in pending]
+        if not any(changed):
+            return
 
         # Mark as changed
         self.on_change()
-        self._update_npc_list()
+        if self._write_name in pending:
+            self._display_names.pop(self.current_npc.id, None)
+            # Only this NPC's row shows the name; redraw just that row
+            index = self._npc_index.get(self.current_npc.id)
+            if index is None:
+                self._update_npc_list()
+            else:
+                self.npc_list.update_item(index, self._display_name(self.current_npc))
+
+    # Per-field writeback: each copies one widget's value into the current NPC
+    # and returns True if that changed it
+
+    @staticmethod
+    def _assign(obj, attr: str, value) -> bool:
+        """Set obj.attr to value if it differs; return True if it did"""
+        if getattr(obj, attr) == value:
+            return False
+        setattr(obj, attr, value)
+        return True
+
+    @staticmethod
+    def _assign_item(mapping: dict, key: str, value: str) -> bool:
+        """Set mapping[key] to value, or remove the key for an empty value; return True on change"""
+        if mapping.get(key) == (value or None):
+            return False
+        if value:
+            mapping[key] = value
+        else:
+            del mapping[key]
+        return True
+
+    def _write_name(self):
+        return self._assign(self.current_npc, 'name', self.name_var.get())
+
+    def _write_description(self):
+        return self._assign(self.current_npc, 'description', self.desc_text.get_content())
+
+    def _write_personality(self):
+        return self._assign(self.current_npc, 'personality', self.personality_var.get())
+
+    def _write_dialogue(self, attr: str):
+        return self._assign(self.current_npc.dialogue, attr, self.dialogue_editors[attr].get_content())
+
+    def _write_keywords(self):
+        return self._assign(self.current_npc, 'keywords', self.keywords_editor.get_pairs())
+
+    def _write_tick_interval(self):
+        try:
+            return self._assign(self.current_npc.movement, 'tick_interval', self.tick_interval_var.get())
+        except tk.TclError:
+            return False  # Spinbox is mid-edit (empty or partial number); keep the old value
+
+    def _write_movement_probability(self):
+        try:
+            return self._assign(self.current_npc.movement, 'movement_probability', self.movement_prob_var.get())
+        except tk.TclError:
+            return False
+
+    def _write_schedule(self, time_slot: str):
+        value = self.schedule_entries[time_slot].get().strip()
+        return self._assign_item(self.current_npc.movement.schedule, time_slot, value)
+
+    def _write_ambient(self):
+        ambient_text = self.ambient_text.get_content()
+        actions = [line for line in map(str.strip, ambient_text.splitlines()) if line]
+        return self._assign(self.current_npc, 'ambient_actions', actions)
+
+    def _write_memory(self):
+        memory = self.current_npc.memory
+        try:
+            # | rather than `or`, so every field is written
+            return (self._assign(memory, 'remember_names', self.remember_names_var.get())
+                    | self._assign(memory, 'remember_topics', self.remember_topics_var.get())
+                    | self._assign(memory, 'memory_duration', self.memory_duration_var.get()))
+        except tk.TclError:
+            return False
+
+    def _write_context(self):
+        context = self.current_npc.context
+        return (self._assign(context, 'time_aware', self.time_aware_var.get())
+                | self._assign(context, 'crowd_aware', self.crowd_aware_var.get()))
+
+    def _write_crowd_reaction(self, crowd_level: str):
+        value = self.crowd_reaction_entries[crowd_level].get().strip()
+        return self._assign_item(self.current_npc.context.crowd_reactions, crowd_level, value)
 
     def add_npc(self):
         """Add a new NPC"""
@@ -406,6 +581,7 @@ class NPCEditor(tk.Frame):
             context=NPCContext()
         )
 
+        self.flush_pending_edits()
         self.world_data.npcs[npc_id] = new_npc
 
         # Update UI
@@ -430,16 +606,15 @@ class NPCEditor(tk.Frame):
         )
 
         if result:
+            self._discard_pending_edits()
             npc_id = self.current_npc.id
 
             # Remove from NPCs
             del self.world_data.npcs[npc_id]
+            self._display_names.pop(npc_id, None)
 
             # Remove from room spawn lists
-            all_rooms = self.world_data.get_all_rooms()
-            for room in all_rooms.values():
-                if npc_id in room.npcs:
-                    room.npcs.remove(npc_id)
+            self.world_data.remove_npc_from_rooms(npc_id)
 
             # Clear selection
             self.current_npc = None
@@ -453,6 +628,7 @@ class NPCEditor(tk.Frame):
         if not self.current_npc:
             messagebox.showwarning("No Selection", "Please select an NPC to duplicate")
             return
+        self.flush_pending_edits()
 
         # Get new ID
         npc_id = simpledialog.askstring(
@@ -472,38 +648,10 @@ class NPCEditor(tk.Frame):
             messagebox.showerror("Duplicate ID", f"NPC '{npc_id}' already exists")
             return
 
-        # Create duplicate
-        new_npc = NPC(
-            id=npc_id,
-            name=f"{self.current_npc.name} (Copy)",
-            description=self.current_npc.description,
-            personality=self.current_npc.personality,
-            dialogue=NPCDialogue(
-                greeting_new=self.current_npc.dialogue.greeting_new,
-                greeting_return=self.current_npc.dialogue.greeting_return,
-                farewell=self.current_npc.dialogue.farewell,
-                player_arrival=self.current_npc.dialogue.player_arrival,
-                player_departure=self.current_npc.dialogue.player_departure
-            ),
-            keywords=self.current_npc.keywords.copy(),
-            movement=NPCMovement(
-                allowed_rooms=self.current_npc.movement.allowed_rooms.copy(),
-                tick_interval=self.current_npc.movement.tick_interval,
-                movement_probability=self.current_npc.movement.movement_probability,
-                schedule=self.current_npc.movement.schedule.copy()
-            ),
-            ambient_actions=self.current_npc.ambient_actions.copy(),
-            memory=NPCMemory(
-                remember_names=self.current_npc.memory.remember_names,
-                remember_topics=self.current_npc.memory.remember_topics,
-                memory_duration=self.current_npc.memory.memory_duration
-            ),
-            context=NPCContext(
-                time_aware=self.current_npc.context.time_aware,
-                crowd_aware=self.current_npc.context.crowd_aware,
-                crowd_reactions=self.current_npc.context.crowd_reactions.copy()
-            )
-        )
+        # Create duplicate; deepcopy so no list or dict is shared with the original
+        new_npc = copy.deepcopy(self.current_npc)
+        new_npc.id = npc_id
+        new_npc.name = f"{self.current_npc.name} (Copy)"
 
         self.world_data.npcs[npc_id] = new_npc
 
@@ -516,15 +664,19 @@ class NPCEditor(tk.Frame):
         if not self.current_npc:
             return
 
-        # Show room picker
+        # Show room picker, reusing the dialog and its room list between calls
         all_rooms = self.world_data.get_all_rooms()
-        dialog = RoomPicker(self, all_rooms, "Select Room")
-        self.wait_window(dialog)
-
-        if dialog.result:
-            if dialog.result not in self.current_npc.movement.allowed_rooms:
-                self.current_npc.movement.allowed_rooms.append(dialog.result)
-                self.allowed_rooms_listbox.insert(tk.END, dialog.result)
+        if self._room_picker is None:
+            self._room_picker = RoomPicker(self, all_rooms, "Select Room")
+        else:
+            self._room_picker.set_rooms(all_rooms)
+        room_id = self._room_picker.show()
+
+        if room_id:
+            if room_id not in self.current_npc.movement.allowed_rooms:
+                self.current_npc.movement.allowed_rooms.append(room_id)
+                self.allowed_rooms_listbox.insert(tk.END, room_id)
+                self._displayed.pop('allowed_rooms', None)
                 self.on_change()
 
     def _remove_allowed_room(self):
@@ -535,6 +687,7 @@ class NPCEditor(tk.Frame):
             room_id = self.allowed_rooms_listbox.get(index)
             self.current_npc.movement.allowed_rooms.remove(room_id)
             self.allowed_rooms_listbox.delete(index)
+            self._displayed.pop('allowed_rooms', None)
             self.on_change()
 
     def show_search(self):
@@ -3,29 +3,145 @@ Room editor with visual graph
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from typing import Optional, Callable, Dict, Set
+from typing import Optional, Callable, Dict, List, Set, Tuple
 import math
+import os
 
 from .models import Room, Zone
 from .components import SearchableListbox, TextEditor, RoomPicker
 from .utils import validate_room_id, get_direction_opposite, format_room_display_name
 
 
+def _force_layout(positions: Dict[str, Tuple[float, float]], edges: Set[Tuple[str, str]],
+                  spacing: float, iterations: int = 50) -> Dict[str, Tuple[float, float]]:
+    """Spread rooms out with a Fruchterman-Reingold force-directed layout
+
+    Starting from positions, rooms joined by an edge pull together and all rooms
+    push apart, settling about spacing apart. Repulsion only counts rooms within
+    two spacings, found through a grid of cells that size, so an iteration costs
+    roughly linear time in the number of rooms rather than quadratic.
+    """
+    room_ids = list(positions)
+    index = {room_id: i for i, room_id in enumerate(room_ids)}
+    xs = [float(positions[room_id][0]) for room_id in room_ids]
+    ys = [float(positions[room_id][1]) for room_id in room_ids]
+    pairs = [(index[a], index[b]) for a, b in edges]
+    count = len(room_ids)
+
+    k2 = spacing * spacing
+    cell = 2 * spacing
+    cutoff2 = cell * cell
+
+    for step in range(iterations):
+        # Linear cooling caps how far a room may move this iteration
+        temperature = spacing * (1 - step / iterations)
+        fx = [0.0] * count
+        fy = [0.0] * count
+
+        # Repulsion k^2/d between rooms in neighbouring cells
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        for i in range(count):
+            grid.setdefault((int(xs[i] // cell), int(ys[i] // cell)), []).append(i)
+        for (cx, cy), members in grid.items():
+            neighbours = [j for ox in (-1, 0, 1) for oy in (-1, 0, 1)
+                          for j in grid.get((cx + ox, cy + oy), ())]
+            for i in members:
+                xi, yi = xs[i], ys[i]
+                force_x = force_y = 0.0
+                for j in neighbours:
+                    if j == i:
+                        continue
+                    dx = xi - xs[j]
+                    dy = yi - ys[j]
+                    d2 = dx * dx + dy * dy
+                    if d2 >= cutoff2:
+                        continue
+                    if d2 == 0.0:
+                        # Coincident rooms: separate them in a fixed direction
+                        dx, d2 = (1.0 if i > j else -1.0), 1.0
+                    force_x += dx * k2 / d2
+                    force_y += dy * k2 / d2
+                fx[i] += force_x
+                fy[i] += force_y
+
+        # Attraction d^2/k along edges
+        for i, j in pairs:
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            d = math.hypot(dx, dy)
+            pull_x = dx * d / spacing
+            pull_y = dy * d / spacing
+            fx[i] -= pull_x
+            fy[i] -= pull_y
+            fx[j] += pull_x
+            fy[j] += pull_y
+
+        for i in range(count):
+            length = math.hypot(fx[i], fy[i])
+            if length > temperature:
+                scale = temperature / length
+                xs[i] += fx[i] * scale
+                ys[i] += fy[i] * scale
+            else:
+                xs[i] += fx[i]
+                ys[i] += fy[i]
+
+    return {room_id: (xs[i], ys[i]) for i, room_id in enumerate(room_ids)}
+
+
 class RoomEditor(tk.Frame):
     """Room editing interface with visual graph"""
 
+    # Room node size and fill colours on the graph canvas
+    NODE_WIDTH = 120
+    NODE_HEIGHT = 60
+    NODE_COLOR = "#e0e0e0"
+    SELECTED_NODE_COLOR = "#ffcc00"
+    # Rooms this far outside the visible part of the canvas are still drawn,
+    # so small scrolls do not need a redraw
+    VIEW_MARGIN = 200
+    # Cell size of the grid used to find the room under the mouse
+    HIT_CELL = 60
+
     def __init__(self, parent, world_data, on_change_callback: Callable):
         super().__init__(parent)
         self.world_data = world_data
         self.on_change = on_change_callback
         self.current_room = None
         self.current_zone = None
+        # Set by the main window when the data changes while this tab is hidden
+        self.needs_refresh = False
 
         # Room positions for visual graph
         self.room_positions = {}
         self.selected_room = None
         self.dragging_room = None
         self.drag_data = {"x": 0, "y": 0}
+        self._list_index = {}  # Room id -> position in the room list
+        self._npc_list_ids = []  # NPC id per row of the room NPC checklist
+        # Property key -> value last put into its widget; cleared on any user edit
+        self._displayed = {}
+        # ASCII art path -> ((mtime_ns, size), content), re-read when the file changes
+        self._ascii_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._ascii_after_id = None  # Pending preview while the file name is typed
+        self._display_names = {}  # Room id -> formatted list label; see _display_name
+        # Canvas items of the drawn graph, so a moved room can be updated in place:
+        # room ID -> (rectangle, name text, ID text), and room ID -> the
+        # (line, from room, to room) of every connection touching it
+        self._room_items: Dict[str, Tuple[int, int, int]] = {}
+        self._room_edges: Dict[str, List[Tuple[int, str, str]]] = {}
+        # Hit-test grid of the drawn rooms: cell -> room IDs whose node
+        # overlaps it, and room ID -> the cells it was registered in
+        self._hit_grid: Dict[Tuple[int, int], List[str]] = {}
+        self._hit_cells: Dict[str, List[Tuple[int, int]]] = {}
+        # Canvas area the graph was last drawn for (None: all of it), and the
+        # pending redraw after the view moved outside it
+        self._drawn_region: Optional[Tuple[float, float, float, float]] = None
+        self._view_after_id = None
+        # Rooms dragged since the canvas was last updated; moved once idle so
+        # a burst of motion events costs one canvas update
+        self._moved_rooms: Set[str] = set()
+        self._move_after_id = None
 
         self._create_ui()
         self.refresh()
@@ -78,9 +194,9 @@ class RoomEditor(tk.Frame):
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
         # Canvas scrollbars
-        h_scroll = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        h_scroll = tk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self._xview)
         h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-        v_scroll = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        v_scroll = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self._yview)
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         self.canvas.config(xscrollcommand=h_scroll.set, yscrollcommand=v_scroll.set)
@@ -96,6 +212,7 @@ class RoomEditor(tk.Frame):
         self.canvas.bind("<Button-1>", self._on_canvas_click)
         self.canvas.bind("<B1-Motion>", self._on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_canvas_release)
+        self.canvas.bind("<Configure>", lambda event: self._on_view_changed())
 
         # Right panel - Room properties
         right_panel = tk.Frame(paned)
@@ -192,6 +309,8 @@ class RoomEditor(tk.Frame):
         self.npc_listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE, yscrollcommand=scrollbar.set)
         self.npc_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.npc_listbox.yview)
+        # Unapplied ticks no longer match the room's NPCs
+        self.npc_listbox.bind('<<ListboxSelect>>', lambda event: self._displayed.pop('npcs', None))
 
         # Update button
         tk.Button(npcs_frame, text="Update NPCs", command=self._update_room_npcs).pack(pady=5)
@@ -220,6 +339,9 @@ class RoomEditor(tk.Frame):
 
     def refresh(self):
         """Refresh the display"""
+        self.needs_refresh = False
+        self._display_names.clear()  # The rooms may have been reloaded
+        self._displayed.clear()  # So may the NPCs the checklist shows
         # Update zone list with "All Zones" option
         zone_names = ['All Zones'] + list(self.world_data.zones.keys())
         self.zone_combo['values'] = zone_names
@@ -245,31 +367,33 @@ class RoomEditor(tk.Frame):
         if self.current_zone is None:
             # Show all rooms from all zones
             room_names = []
+            room_ids = []
             for zone in self.world_data.zones.values():
                 for room in zone.rooms.values():
-                    room_names.append(format_room_display_name(room))
+                    room_names.append(self._display_name(room))
+                    room_ids.append(room.id)
         else:
-            room_names = [format_room_display_name(room) for room in self.current_zone.rooms.values()]
+            room_names = [self._display_name(room) for room in self.current_zone.rooms.values()]
+            room_ids = list(self.current_zone.rooms)
+
+        self._list_index = {room_id: i for i, room_id in enumerate(room_ids)}
+        self.room_list.set_items(room_names, room_ids)
 
-        self.room_list.set_items(room_names)
+    def _display_name(self, room: Room) -> str:
+        """Get a room's list label, formatting it only when not cached"""
+        name = self._display_names.get(room.id)
+        if name is None:
+            name = self._display_names[room.id] = format_room_display_name(room)
+        return name
 
     def _on_room_selected(self):
         """Handle room selection"""
-        selected = self.room_list.get_selected()
-        if selected:
-            # Extract room ID from display name
-            room_id = selected.split('(')[-1].rstrip(')')
-
-            # Find the room in the appropriate zone
-            if self.current_zone is None:
-                # Search all zones
-                for zone in self.world_data.zones.values():
-                    if room_id in zone.rooms:
-                        self.current_room = zone.rooms[room_id]
-                        break
-            else:
-                if room_id in self.current_zone.rooms:
-                    self.current_room = self.current_zone.rooms[room_id]
+        room_id = self.room_list.get_selected_key()
+        if room_id:
+            # The list only holds rooms of the current zone (or of all zones)
+            room = self.world_data.get_room_by_id(room_id)
+            if room:
+                self.current_room = room
 
             if self.current_room:
                 self._update_properties()
@@ -283,9 +407,11 @@ class RoomEditor(tk.Frame):
         # Set flag to prevent change events from firing
         self._updating_properties = True
 
+        room = self.current_room
+
         # Basic properties
-        self.id_var.set(self.current_room.id)
-        self.name_var.set(self.current_room.name)
+        self._show('id', room.id, self.id_var.set)
+        self._show('name', room.name, self.name_var.set)
 
         # Update description - schedule it to run after GUI updates
         def update_description():
@@ -300,29 +426,57 @@ class RoomEditor(tk.Frame):
         self.after(10, update_description)
 
         # ASCII art
-        self.ascii_var.set(self.current_room.ascii_art_file or "")
-        self._preview_ascii_art()
+        self._show('ascii', room.ascii_art_file or "", self._show_ascii_art)
 
         # Exits
-        self.exits_tree.delete(*self.exits_tree.get_children())
-        for direction, target in self.current_room.exits.items():
-            self.exits_tree.insert('', tk.END, values=(direction, target))
+        self._show('exits', tuple(room.exits.items()), self._show_exits)
 
         # NPCs
-        self._update_npc_list()
+        self._show('npcs', tuple(room.npcs), lambda npcs: self._update_npc_list())
+
+    def _show(self, key, value, show: Callable):
+        """Call show(value) unless the widget for key already displays value
+
+        Moving between rooms then skips rebuilding the exits and NPC lists
+        (and the other widget writes) for properties that are the same.
+        """
+        displayed = self._displayed
+        if key in displayed and displayed[key] == value:
+            return
+        show(value)
+        displayed[key] = value
+
+    def _show_ascii_art(self, ascii_file: str):
+        self.ascii_var.set(ascii_file)
+        self._preview_ascii_art()
+
+    def _show_exits(self, exits: Tuple[Tuple[str, str], ...]):
+        self.exits_tree.delete(*self.exits_tree.get_children())
+        for direction, target in exits:
+            self.exits_tree.insert('', tk.END, values=(direction, target))
 
     def _update_npc_list(self):
         """Update the NPC checklist"""
         self.npc_listbox.delete(0, tk.END)
 
-        # Add all NPCs to list
-        for npc_id, npc in self.world_data.npcs.items():
-            display_name = f"{npc.name} ({npc_id})"
-            self.npc_listbox.insert(tk.END, display_name)
-
-            # Select if NPC is in this room
-            if self.current_room and npc_id in self.current_room.npcs:
-                self.npc_listbox.selection_set(tk.END)
+        # Add all NPCs to list in one call
+        npcs = self.world_data.npcs
+        self._npc_list_ids = list(npcs)
+        self.npc_listbox.insert(tk.END, *[f"{npc.name} ({npc_id})" for npc_id, npc in npcs.items()])
+
+        # Select the NPCs in this room, one call per run of adjacent rows
+        if self.current_room and self.current_room.npcs:
+            room_npcs = set(self.current_room.npcs)
+            start = None
+            for i, npc_id in enumerate(self._npc_list_ids):
+                if npc_id in room_npcs:
+                    if start is None:
+                        start = i
+                elif start is not None:
+                    self.npc_listbox.selection_set(start, i - 1)
+                    start = None
+            if start is not None:
+                self.npc_listbox.selection_set(start, len(self._npc_list_ids) - 1)
 
     def _on_desc_changed(self, event=None):
         """Handle description text changes"""
@@ -340,30 +494,65 @@ class RoomEditor(tk.Frame):
         if not self.current_room or self._updating_properties:
             return
 
+        self._displayed.clear()  # A widget no longer shows what we put there
+
         # Update room data
         self.current_room.name = self.name_var.get()
+        self._display_names.pop(self.current_room.id, None)
 
         # Mark as changed
         self.on_change()
-        self._update_room_list()
+        # Only this room's row shows the name; redraw just that row
+        index = self._list_index.get(self.current_room.id)
+        if index is None:
+            self._update_room_list()
+        else:
+            self.room_list.update_item(index, self._display_name(self.current_room))
 
     def _on_ascii_changed(self):
         """Handle ASCII art file change"""
-        if not self.current_room:
+        if not self.current_room or self._updating_properties:
             return
+        self._displayed.clear()
 
         # Update room data
         self.current_room.ascii_art_file = self.ascii_var.get() or None
 
-        # Preview the ASCII art
-        self._preview_ascii_art()
+        # Preview the ASCII art once typing pauses
+        if self._ascii_after_id is not None:
+            self.after_cancel(self._ascii_after_id)
+        self._ascii_after_id = self.after(150, self._preview_ascii_art)
 
         # Mark as changed
         self.on_change()
 
     def _draw_graph(self):
-        """Draw the room graph on canvas"""
+        """Draw the room graph on canvas
+
+        Rebuilds every canvas item; use _move_room and _highlight_room_on_canvas
+        for changes to a single room.
+        """
         self.canvas.delete("all")
+        self._room_items = {}
+        self._room_edges = {}
+        self._hit_grid = {}
+        self._hit_cells = {}
+        if self._view_after_id is not None:
+            self.after_cancel(self._view_after_id)
+            self._view_after_id = None
+        if self._move_after_id is not None:
+            self.after_cancel(self._move_after_id)
+            self._move_after_id = None
+        self._moved_rooms.clear()
+
+        # Only draw what is in or near the visible part of the canvas
+        region = self._visible_region(self.VIEW_MARGIN)
+        self._drawn_region = region
+        if region is None:
+            view_x0 = view_y0 = -math.inf
+            view_x1 = view_y1 = math.inf
+        else:
+            view_x0, view_y0, view_x1, view_y1 = region
 
         # Get rooms to draw
         if self.current_zone is None:
@@ -375,9 +564,11 @@ class RoomEditor(tk.Frame):
         if not rooms_to_draw:
             return
 
-        # Generate positions if needed
+        # Generate positions if needed; _auto_layout then draws the graph itself,
+        # so drawing here as well would leave a second, untracked copy behind
         if not self.room_positions:
             self._auto_layout()
+            return
 
         # Draw connections first (so they appear behind rooms)
         for room_id, room in rooms_to_draw.items():
@@ -388,29 +579,109 @@ class RoomEditor(tk.Frame):
                     if target_id in self.room_positions:
                         x2, y2 = self.room_positions[target_id]
 
+                        # Skip lines with both ends off the same side of the view
+                        if ((x1 < view_x0 and x2 < view_x0) or (x1 > view_x1 and x2 > view_x1) or
+                                (y1 < view_y0 and y2 < view_y0) or (y1 > view_y1 and y2 > view_y1)):
+                            continue
+
                         # Draw arrow
-                        self.canvas.create_line(
+                        line = self.canvas.create_line(
                             x1, y1, x2, y2,
                             fill="gray", width=2,
                             arrow=tk.LAST, arrowshape=(10, 12, 5),
                             tags=("connection", f"from_{room_id}", f"to_{target_id}")
                         )
+                        edge = (line, room_id, target_id)
+                        self._room_edges.setdefault(room_id, []).append(edge)
+                        if target_id != room_id:
+                            self._room_edges.setdefault(target_id, []).append(edge)
 
         # Draw rooms
+        half_width = self.NODE_WIDTH // 2
+        half_height = self.NODE_HEIGHT // 2
         for room_id, room in rooms_to_draw.items():
             if room_id in self.room_positions:
                 x, y = self.room_positions[room_id]
-                self._draw_room_node(room_id, room, x, y)
+                if (x + half_width < view_x0 or x - half_width > view_x1 or
+                        y + half_height < view_y0 or y - half_height > view_y1):
+                    continue
+                self._room_items[room_id] = self._draw_room_node(room_id, room, x, y)
+                self._add_room_hit_area(room_id)
+
+    def _add_room_hit_area(self, room_id: str):
+        """Register a drawn room's node in the hit-test grid"""
+        x, y = self.room_positions[room_id]
+        half_width = self.NODE_WIDTH // 2
+        half_height = self.NODE_HEIGHT // 2
+        cell = self.HIT_CELL
+        cells = [(cx, cy)
+                 for cx in range(int((x - half_width) // cell), int((x + half_width) // cell) + 1)
+                 for cy in range(int((y - half_height) // cell), int((y + half_height) // cell) + 1)]
+        for key in cells:
+            self._hit_grid.setdefault(key, []).append(room_id)
+        self._hit_cells[room_id] = cells
+
+    def _remove_room_hit_area(self, room_id: str):
+        """Remove a room's node from the hit-test grid"""
+        for key in self._hit_cells.pop(room_id, ()):
+            room_ids = self._hit_grid[key]
+            room_ids.remove(room_id)
+            if not room_ids:
+                del self._hit_grid[key]
+
+    def _room_at(self, x: float, y: float) -> Optional[str]:
+        """Get the ID of the drawn room whose node contains a canvas point"""
+        cell = self.HIT_CELL
+        half_width = self.NODE_WIDTH // 2
+        half_height = self.NODE_HEIGHT // 2
+        # Most recently registered first, which is the one drawn on top
+        for room_id in reversed(self._hit_grid.get((int(x // cell), int(y // cell)), ())):
+            room_x, room_y = self.room_positions[room_id]
+            if abs(x - room_x) <= half_width and abs(y - room_y) <= half_height:
+                return room_id
+        return None
+
+    def _visible_region(self, margin: int = 0) -> Optional[Tuple[float, float, float, float]]:
+        """Get the visible canvas area grown by margin, or None if the canvas is not shown yet"""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return None
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        return (x0 - margin, y0 - margin, x0 + width + margin, y0 + height + margin)
+
+    def _on_view_changed(self):
+        """Redraw the graph once idle if the view moved past the area drawn for it"""
+        drawn = self._drawn_region
+        if drawn is None or self._view_after_id is not None:
+            return
+        view = self._visible_region()
+        if view is None:
+            return
+        if (view[0] < drawn[0] or view[1] < drawn[1] or
+                view[2] > drawn[2] or view[3] > drawn[3]):
+            self._view_after_id = self.after_idle(self._draw_graph)
 
-    def _draw_room_node(self, room_id: str, room: Room, x: int, y: int):
-        """Draw a single room node"""
-        width = 120
-        height = 60
+    def _xview(self, *args):
+        """Scroll the canvas horizontally (scrollbar command)"""
+        self.canvas.xview(*args)
+        self._on_view_changed()
+
+    def _yview(self, *args):
+        """Scroll the canvas vertically (scrollbar command)"""
+        self.canvas.yview(*args)
+        self._on_view_changed()
+
+    def _draw_room_node(self, room_id: str, room: Room, x: int, y: int) -> Tuple[int, int, int]:
+        """Draw a single room node, returning its rectangle and text item IDs"""
+        width = self.NODE_WIDTH
+        height = self.NODE_HEIGHT
 
         # Determine color
-        color = "#e0e0e0"
+        color = self.NODE_COLOR
         if room_id == self.selected_room:
-            color = "#ffcc00"
+            color = self.SELECTED_NODE_COLOR
 
         # Draw rectangle
         rect = self.canvas.create_rectangle(
@@ -421,7 +692,7 @@ class RoomEditor(tk.Frame):
         )
 
         # Draw room name
-        self.canvas.create_text(
+        name_text = self.canvas.create_text(
             x, y - 10,
             text=room.name,
             font=("Arial", 10, "bold"),
@@ -429,7 +700,7 @@ class RoomEditor(tk.Frame):
         )
 
         # Draw room ID
-        self.canvas.create_text(
+        id_text = self.canvas.create_text(
             x, y + 10,
             text=f"({room_id})",
             font=("Arial", 8),
@@ -437,22 +708,47 @@ class RoomEditor(tk.Frame):
             tags=("room_text", room_id)
         )
 
+        return rect, name_text, id_text
+
+    def _move_room(self, room_id: str):
+        """Move a drawn room and its connections to its position in room_positions"""
+        items = self._room_items.get(room_id)
+        if items is None:
+            return
+        rect, name_text, id_text = items
+        x, y = self.room_positions[room_id]
+        half_width = self.NODE_WIDTH // 2
+        half_height = self.NODE_HEIGHT // 2
+
+        coords = self.canvas.coords
+        coords(rect, x - half_width, y - half_height, x + half_width, y + half_height)
+        coords(name_text, x, y - 10)
+        coords(id_text, x, y + 10)
+
+        positions = self.room_positions
+        for line, from_id, to_id in self._room_edges.get(room_id, ()):
+            coords(line, *positions[from_id], *positions[to_id])
+
+        self._remove_room_hit_area(room_id)
+        self._add_room_hit_area(room_id)
+
     def _auto_layout(self):
-        """Automatically layout rooms in a grid"""
+        """Automatically layout rooms, placing connected rooms near each other"""
         # Clear positions
         self.room_positions = {}
 
         # Get rooms to layout
         if self.current_zone is None:
             # Layout all rooms from all zones
-            rooms = list(self.world_data.get_all_rooms().keys())
+            room_map = self.world_data.get_all_rooms()
         else:
-            rooms = list(self.current_zone.rooms.keys())
+            room_map = self.current_zone.rooms
+        rooms = list(room_map.keys())
 
         if not rooms:
             return
 
-        # Simple grid layout
+        # Start from a grid
         cols = max(3, int(math.sqrt(len(rooms))))
 
         for i, room_id in enumerate(rooms):
@@ -462,6 +758,19 @@ class RoomEditor(tk.Frame):
             y = 100 + row * 120
             self.room_positions[room_id] = (x, y)
 
+        # Then let the exits pull connected rooms together
+        edges = {(room_id, target_id) if room_id < target_id else (target_id, room_id)
+                 for room_id, room in room_map.items()
+                 for target_id in room.exits.values()
+                 if target_id != room_id and target_id in room_map}
+        if edges:
+            positions = _force_layout(self.room_positions, edges, spacing=180)
+            # Shift back so the top-left room sits where the grid started
+            min_x = min(x for x, y in positions.values())
+            min_y = min(y for x, y in positions.values())
+            self.room_positions = {room_id: (round(x - min_x + 150), round(y - min_y + 100))
+                                   for room_id, (x, y) in positions.items()}
+
         # Update canvas scroll region to fit all rooms
         if self.room_positions:
             max_x = max(pos[0] for pos in self.room_positions.values()) + 200
@@ -474,46 +783,25 @@ class RoomEditor(tk.Frame):
         """Center the canvas view"""
         self.canvas.xview_moveto(0)
         self.canvas.yview_moveto(0)
+        self._on_view_changed()
 
     def _on_canvas_click(self, event):
         """Handle canvas click"""
-        # Get clicked item
-        clicked = self.canvas.find_overlapping(event.x, event.y, event.x, event.y)
-
-        for item in clicked:
-            tags = self.canvas.gettags(item)
-            if "room" in tags:
-                # Found a room
-                for tag in tags:
-                    if tag != "room" and tag != "room_text":
-                        self.selected_room = tag
-                        self.dragging_room = tag
-                        self.drag_data["x"] = event.x
-                        self.drag_data["y"] = event.y
-
-                        # Select in list
-                        room = None
-                        if self.current_zone is None:
-                            # Find room in all zones
-                            for zone in self.world_data.zones.values():
-                                if self.selected_room in zone.rooms:
-                                    room = zone.rooms[self.selected_room]
-                                    break
-                        elif self.selected_room in self.current_zone.rooms:
-                            room = self.current_zone.rooms[self.selected_room]
-
-                        if room:
-                            display_name = format_room_display_name(room)
-                            # Find and select in list
-                            for i, item in enumerate(self.room_list.filtered_items):
-                                if item == display_name:
-                                    self.room_list.listbox.selection_clear(0, tk.END)
-                                    self.room_list.listbox.selection_set(i)
-                                    self._on_room_selected()
-                                    break
-
-                        self._draw_graph()
-                        return
+        # Get clicked room (the event is in window coordinates)
+        room_id = self._room_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        if room_id is None:
+            return
+
+        self.dragging_room = room_id
+        self.drag_data["x"] = event.x
+        self.drag_data["y"] = event.y
+
+        # Select in list
+        if self.world_data.get_room_by_id(room_id):
+            if self.room_list.select_key(room_id):
+                self._on_room_selected()
+
+        self._highlight_room_on_canvas(room_id)
 
     def _on_canvas_drag(self, event):
         """Handle canvas drag"""
@@ -528,7 +816,16 @@ class RoomEditor(tk.Frame):
             self.drag_data["x"] = event.x
             self.drag_data["y"] = event.y
 
-            self._draw_graph()
+            self._moved_rooms.add(self.dragging_room)
+            if self._move_after_id is None:
+                self._move_after_id = self.after_idle(self._flush_moved_rooms)
+
+    def _flush_moved_rooms(self):
+        """Move the canvas items of rooms dragged since the last update"""
+        self._move_after_id = None
+        moved, self._moved_rooms = self._moved_rooms, set()
+        for room_id in moved:
+            self._move_room(room_id)
 
     def _on_canvas_release(self, event):
         """Handle canvas release"""
@@ -536,8 +833,12 @@ class RoomEditor(tk.Frame):
 
     def _highlight_room_on_canvas(self, room_id: str):
         """Highlight a room on the canvas"""
+        previous = self.selected_room
         self.selected_room = room_id
-        self._draw_graph()
+        if previous in self._room_items:
+            self.canvas.itemconfigure(self._room_items[previous][0], fill=self.NODE_COLOR)
+        if room_id in self._room_items:
+            self.canvas.itemconfigure(self._room_items[room_id][0], fill=self.SELECTED_NODE_COLOR)
 
     def add_room(self):
         """Add a new room"""
@@ -567,7 +868,7 @@ class RoomEditor(tk.Frame):
             description="A new room."
         )
 
-        self.current_zone.rooms[room_id] = new_room
+        self.world_data.add_room(self.current_zone, new_room)
 
         # Add to graph
         if self.room_positions:
@@ -602,20 +903,15 @@ class RoomEditor(tk.Frame):
             room_id = self.current_room.id
 
             # Remove from zone
-            del self.current_zone.rooms[room_id]
+            self.world_data.remove_room(self.current_zone, room_id)
+            self._display_names.pop(room_id, None)
 
             # Remove from positions
             if room_id in self.room_positions:
                 del self.room_positions[room_id]
 
             # Remove exits pointing to this room
-            for room in self.current_zone.rooms.values():
-                exits_to_remove = [
-                    direction for direction, target in room.exits.items()
-                    if target == room_id
-                ]
-                for direction in exits_to_remove:
-                    del room.exits[direction]
+            self.world_data.remove_exits_to(room_id)
 
             # Clear selection
             self.current_room = None
@@ -660,7 +956,7 @@ class RoomEditor(tk.Frame):
             npcs=self.current_room.npcs.copy()
         )
 
-        self.current_zone.rooms[room_id] = new_room
+        self.world_data.add_room(self.current_zone, new_room)
 
         # Update UI
         self.on_change()
@@ -684,7 +980,7 @@ class RoomEditor(tk.Frame):
             direction, target_id = dialog.result
 
             # Add exit
-            self.current_room.exits[direction] = target_id
+            self.world_data.set_exit(self.current_room, direction, target_id)
 
             # Update UI
             self.on_change()
@@ -703,7 +999,7 @@ class RoomEditor(tk.Frame):
 
         # Remove exit
         if direction in self.current_room.exits:
-            del self.current_room.exits[direction]
+            self.world_data.remove_exit(self.current_room, direction)
 
             # Update UI
             self.on_change()
@@ -738,7 +1034,7 @@ class RoomEditor(tk.Frame):
             return
 
         # Add opposite exit
-        target_room.exits[opposite] = self.current_room.id
+        self.world_data.set_exit(target_room, opposite, self.current_room.id)
 
         # Update UI
         self.on_change()
@@ -751,17 +1047,10 @@ class RoomEditor(tk.Frame):
             return
 
         # Get selected NPCs
-        selected_indices = self.npc_listbox.curselection()
-        selected_npcs = []
-
-        for index in selected_indices:
-            display_name = self.npc_listbox.get(index)
-            # Extract NPC ID
-            npc_id = display_name.split('(')[-1].rstrip(')')
-            selected_npcs.append(npc_id)
+        selected_npcs = [self._npc_list_ids[index] for index in self.npc_listbox.curselection()]
 
         # Update room
-        self.current_room.npcs = selected_npcs
+        self.world_data.set_room_npcs(self.current_room, selected_npcs)
 
         # Update UI
         self.on_change()
@@ -793,6 +1082,9 @@ class RoomEditor(tk.Frame):
 
     def _preview_ascii_art(self):
         """Preview ASCII art file content"""
+        if self._ascii_after_id is not None:
+            self.after_cancel(self._ascii_after_id)
+            self._ascii_after_id = None
         ascii_file = self.ascii_var.get()
         if not ascii_file:
             self.ascii_preview.set_content("")
@@ -809,18 +1101,36 @@ class RoomEditor(tk.Frame):
         ]
 
         for path in possible_paths:
-            if path and path.exists():
-                try:
-                    with open(path, 'r') as f:
-                        content = f.read()
-                        self.ascii_preview.set_content(content)
-                        return
-                except Exception as e:
-                    pass
+            if path:
+                content = self._read_ascii_art(str(path))
+                if content is not None:
+                    self.ascii_preview.set_content(content)
+                    return
 
         # File not found
         self.ascii_preview.set_content(f"[ASCII art file not found: {ascii_file}]")
 
+    def _read_ascii_art(self, path: str) -> Optional[str]:
+        """Read an ASCII art file, reusing the last read while it is unchanged
+
+        Returns None if the file does not exist or cannot be read.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._ascii_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, 'r') as f:
+                content = f.read()
+        except Exception:
+            return None
+        self._ascii_cache[path] = (stamp, content)
+        return content
+
     def show_search(self):
         """Show the search interface"""
         self.room_list.search_entry.focus()
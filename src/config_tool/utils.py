@@ -53,29 +53,6 @@ def find_broken_exits(rooms: Dict[str, Any]) -> List[str]:
     return broken
 
 
-def find_unreachable_rooms(rooms: Dict[str, Any], start_room: str = 'alamo_plaza') -> List[str]:
-    """Find rooms that cannot be reached from the starting room"""
-    if start_room not in rooms:
-        return []
-
-    visited = set()
-    to_visit = [start_room]
-
-    while to_visit:
-        current = to_visit.pop(0)
-        if current in visited:
-            continue
-
-        visited.add(current)
-        if current in rooms:
-            for target in rooms[current].exits.values():
-                if target not in visited and target in rooms:
-                    to_visit.append(target)
-
-    unreachable = [room_id for room_id in rooms.keys() if room_id not in visited]
-    return unreachable
-
-
 def find_orphaned_npcs(npcs: Dict[str, Any], rooms: Dict[str, Any]) -> List[str]:
     """Find NPCs that reference non-existent rooms"""
     orphaned = []
@@ -99,27 +99,12 @@ class ConfigValidator:
         # Find a starting room (prefer 'alamo_plaza' or first room)
         start_room = 'alamo_plaza' if 'alamo_plaza' in all_rooms else next(iter(all_rooms.keys()))
 
-        visited = set()
-        to_visit = [start_room]
-
-        while to_visit:
-            current = to_visit.pop(0)
-            if current in visited:
-                continue
-
-            visited.add(current)
-            if current in all_rooms:
-                for target in all_rooms[current].exits.values():
-                    if target not in visited and target in all_rooms:
-                        to_visit.append(target)
-
         # Find unreachable rooms
-        for room_id in all_rooms.keys():
-            if room_id not in visited:
-                self.errors.append(ValidationError(
-                    'warning', 'room',
-                    f"Room '{room_id}' is unreachable from starting room '{start_room}'"
-                ))
+        for room_id in self.world_data.find_unreachable_rooms(start_room):
+            self.errors.append(ValidationError(
+                'warning', 'room',
+                f"Room '{room_id}' is unreachable from starting room '{start_room}'"
+            ))
 
     def _validate_npc_rooms(self):
         """Check that NPCs reference valid rooms"""
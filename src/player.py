@@ -23,6 +23,8 @@ class Player:
         self.username = username
         self.client = client
         self.current_room_id = world.starting_room
+        self.current_room_name = ""  # Cached name of current_room_id
+        self.refresh_room_name()
         self.last_activity = datetime.now()
 
         # Rate limiting for messages
@@ -30,6 +32,11 @@ class Player:
 
         logger.info(f"Player {username} (ID: {player_id}) initialized")
 
+    def refresh_room_name(self):
+        """Re-cache the current room's name after current_room_id changes."""
+        room = world.get_room(self.current_room_id)
+        self.current_room_name = room.name if room else "Unknown"
+
     async def move_to_room(self, room_id: str, from_direction: Optional[str] = None):
         """Move player to a new room and handle notifications."""
         old_room_id = self.current_room_id
@@ -40,6 +47,8 @@ class Player:
         # Update player state
         self.current_room_id = room_id
         self.client.current_room = room_id
+        self.refresh_room_name()
+        player_manager.update_room_index(self, old_room_id)
 
         # Save to database
         await db.update_player_room(self.id, room_id)
@@ -117,6 +126,27 @@ class PlayerManager:
 
     def __init__(self):
         self.active_players: Dict[int, Player] = {}
+        # room_id -> {player_id: Player}; holds exactly the active players whose
+        # current_room_id is that room. Kept in sync by add_player, remove_player
+        # and update_room_index (called whenever a player changes rooms).
+        self._players_by_room: Dict[str, Dict[int, Player]] = {}
+        # room_id -> {excluded player_id: "a, b, c"}; dropped for a room whenever
+        # its occupants change.
+        self._room_usernames: Dict[str, Dict[Optional[int], str]] = {}
+
+    def update_room_index(self, player: Player, old_room_id: Optional[str] = None):
+        """Move a player's entry in the room index to their current room."""
+        if old_room_id is not None:
+            occupants = self._players_by_room.get(old_room_id)
+            if occupants is not None:
+                occupants.pop(player.id, None)
+                if not occupants:
+                    del self._players_by_room[old_room_id]
+            self._room_usernames.pop(old_room_id, None)
+
+        if player.id in self.active_players:
+            self._players_by_room.setdefault(player.current_room_id, {})[player.id] = player
+            self._room_usernames.pop(player.current_room_id, None)
 
     async def add_player(self, player_id: int, username: str, client: 'Client',
                          room_id: Optional[str] = None) -> Player:
@@ -131,9 +161,11 @@ class PlayerManager:
             player_data = await db.get_player_by_id(player_id)
             if player_data and player_data.get('current_room_id'):
                 player.current_room_id = player_data['current_room_id']
+        player.refresh_room_name()
 
         # Add to active players
         self.active_players[player_id] = player
+        self.update_room_index(player)
 
         # Add to room
         room = world.get_room(player.current_room_id)
@@ -164,6 +196,7 @@ class PlayerManager:
 
         # Remove from active players
         del self.active_players[player_id]
+        self.update_room_index(player, player.current_room_id)
 
         # End database session
         await db.end_session(player_id)
@@ -183,16 +216,18 @@ class PlayerManager:
 
     def get_players_in_room(self, room_id: str) -> List[Player]:
         """Get all players in a specific room."""
-        room = world.get_room(room_id)
-        if not room:
-            return []
-
-        players = []
-        for player_id in room.players:
-            player = self.get_player(player_id)
-            if player:
-                players.append(player)
-        return players
+        occupants = self._players_by_room.get(room_id)
+        return list(occupants.values()) if occupants else []
+
+    def get_room_usernames_excluding(self, room_id: str, exclude_id: Optional[int] = None) -> str:
+        """Get a comma-separated list of usernames in a room, minus one player."""
+        cached = self._room_usernames.setdefault(room_id, {})
+        line = cached.get(exclude_id)
+        if line is None:
+            occupants = self._players_by_room.get(room_id) or {}
+            line = ", ".join(p.username for pid, p in occupants.items() if pid != exclude_id)
+            cached[exclude_id] = line
+        return line
 
     def get_online_players(self) -> List[Player]:
         """Get all online players."""
@@ -4,13 +4,13 @@ import asyncio
 import logging
 import signal
 import sys
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from datetime import datetime
 import telnetlib3
 
 from config import (
     HOST, PORT, MAX_CONNECTIONS, ENCODING,
-    IDLE_TIMEOUT, IDLE_WARNING_TIME
+    IDLE_TIMEOUT, IDLE_WARNING_TIME, WRITE_HIGH_WATER
 )
 from database import db
 from npc_loader import npc_loader
@@ -44,16 +44,55 @@ class Client:
 
         logger.info(f"Client connected from {self.address}")
 
-    async def send(self, message: str):
-        """Send a message to the client."""
+    @staticmethod
+    def encode(message: str) -> bytes:
+        """Encode a message for the wire with telnet line endings."""
+        return message.replace('\n', '\r\n').encode(ENCODING)
+
+    async def send(self, message: Union[str, bytes]):
+        """Send a message to the client. Bytes must already be encoded with Client.encode."""
+        if isinstance(message, str):
+            message = self.encode(message)
+        await self.send_bytes(message)
+
+    async def send_all(self, *parts: str):
+        """Send several message parts as a single write."""
+        await self.send("".join(parts))
+
+    async def send_bytes(self, data: bytes):
+        """Send pre-encoded bytes (telnet line endings already applied)."""
         if not self.is_active or self.writer.transport.is_closing():
             return
 
         try:
-            # Convert message to proper line endings for telnet
-            message = message.replace('\n', '\r\n')
-            # Convert to bytes for binary mode
-            self.writer.write(message.encode(ENCODING))
+            self.writer.write(data)
+            await self.writer.drain()
+        except (ConnectionError, BrokenPipeError):
+            logger.warning(f"Failed to send to {self.address}")
+            self.is_active = False
+
+    def write_nowait(self, data: bytes) -> bool:
+        """Queue pre-encoded bytes without waiting for the transport.
+
+        Returns:
+            True if the output buffer is above the high-water mark and
+            the caller should await drain().
+        """
+        if not self.is_active or self.writer.transport.is_closing():
+            return False
+
+        try:
+            self.writer.write(data)
+        except (ConnectionError, BrokenPipeError):
+            logger.warning(f"Failed to send to {self.address}")
+            self.is_active = False
+            return False
+
+        return self.writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER
+
+    async def drain(self):
+        """Wait for queued output to flush to the transport."""
+        try:
             await self.writer.drain()
         except (ConnectionError, BrokenPipeError):
             logger.warning(f"Failed to send to {self.address}")
@@ -19,6 +19,9 @@ class Room:
     exits: Dict[str, str] = field(default_factory=dict)  # direction -> room_id
     players: Set[int] = field(default_factory=set)  # Set of player IDs in room
     npcs: Set[str] = field(default_factory=set)  # Set of NPC IDs in room
+    # Static part of the room display, built on first render (exits are only
+    # wired up while loading, so this never goes stale)
+    _header: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def get_exit_list(self) -> str:
         """Get formatted string of available exits."""
@@ -26,6 +29,14 @@ class Room:
             return "none"
         return ", ".join(self.exits.keys())
 
+    def render(self, others_line: str = "") -> str:
+        """Get the full room display: name, art, description, exits, then others_line."""
+        if self._header is None:
+            art = f"{self.ascii_art}\n" if self.ascii_art else ""
+            self._header = (f"\n{self.name}\n{art}{self.description}\n"
+                            f"Exits: {self.get_exit_list()}\n")
+        return self._header + others_line
+
     def add_player(self, player_id: int):
         """Add a player to this room."""
         self.players.add(player_id)
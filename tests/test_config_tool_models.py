@@ -0,0 +1,77 @@
+"""Save/load round trips of the config tool's WorldData"""
+import shutil
+from pathlib import Path
+
+import pytest
+
+from config_tool.models import WorldData
+from npc_loader import NPCLoader
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A scratch copy of the shipped room and NPC data"""
+    ignore = shutil.ignore_patterns('_all.yml', '__pycache__')
+    shutil.copytree(DATA_DIR / 'rooms', tmp_path / 'rooms', ignore=ignore)
+    shutil.copytree(DATA_DIR / 'npcs', tmp_path / 'npcs', ignore=ignore)
+    return tmp_path
+
+
+def load(data_dir: Path) -> WorldData:
+    world = WorldData()
+    world.load_from_files(data_dir)
+    return world
+
+
+def test_deleted_npc_matches_server_loader_after_save(data_dir):
+    world = load(data_dir)
+    npc_id = next(iter(world.npcs))
+    del world.npcs[npc_id]
+    world.save_to_files(data_dir)
+
+    # The deleted NPC's file is left on disk, so the server still loads it;
+    # the tool must not hide it behind the bundle or snapshot
+    server_npcs = NPCLoader(str(data_dir / 'npcs')).load_all_npcs()
+    for _ in range(2):  # First reload parses, the second may use the caches
+        assert set(load(data_dir).npcs) == set(server_npcs)
+
+
+def test_direct_exit_edit_survives_save(data_dir):
+    world = load(data_dir)
+    world.save_to_files(data_dir)  # Primes the per-zone dump reuse
+    room = world.get_room_by_id('alamo_plaza')
+    room.exits['up'] = 'mission'
+    world.save_to_files(data_dir)
+
+    assert load(data_dir).get_room_by_id('alamo_plaza').exits == room.exits
+
+
+def test_direct_property_edit_survives_save(data_dir):
+    world = load(data_dir)
+    world.save_to_files(data_dir)
+    room = world.get_room_by_id('alamo_plaza')
+    room.description = 'Edited without going through an editor.'
+    room.npcs.append('priest')
+    world.save_to_files(data_dir)
+
+    reloaded = load(data_dir).get_room_by_id('alamo_plaza')
+    assert reloaded.description == room.description
+    assert reloaded.npcs == room.npcs
+
+
+def test_snapshot_sees_edit_to_zone_file_in_subdirectory(data_dir):
+    rooms_dir = data_dir / 'rooms'
+    (rooms_dir / 'zones').mkdir()
+    (rooms_dir / 'historic.yml').rename(rooms_dir / 'zones' / 'historic.yml')
+    zones_file = rooms_dir / 'zones.yml'
+    zones_file.write_text(zones_file.read_text().replace('file: historic.yml',
+                                                         'file: zones/historic.yml'))
+    assert load(data_dir).get_room_by_id('alamo_plaza').name == 'The Alamo Plaza'
+
+    # Edit the zone file behind the snapshot's back, as a text editor would
+    zone_file = rooms_dir / 'zones' / 'historic.yml'
+    zone_file.write_text(zone_file.read_text().replace('name: The Alamo Plaza', 'name: Plaza'))
+
+    assert load(data_dir).get_room_by_id('alamo_plaza').name == 'Plaza'